@@ -5,7 +5,41 @@ Debug script to test source text extraction and validate content
 
 import json
 import os
-from document_extractor import DocumentExtractor
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple
+from document_extractor import DocumentExtractor, configure_logging
+
+# Optional: Aho-Corasick automaton to find all search terms in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Search terms shared by every company (each company's own name is added per company)
+_TEST_SEARCHES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('company_name', ('brightband', 'company name')),
+    ('industry', ('industry', 'sector', 'media', 'information services')),
+    ('location', ('san francisco', 'location', 'based', 'headquarters')),
+    ('founders', ('julian green', 'founder', 'ceo', 'green')),
+    ('funding', ('series a', '$10', 'million', 'raised', 'prelude')),
+    ('valuation', ('$38', 'valuation', 'post-money', '38 million'))
+)
+
+def _with_prefetched_files(extractor: DocumentExtractor, companies: List[Dict[str, Any]]) -> Iterator[Tuple[Dict[str, Any], Dict[str, bytes]]]:
+    """Yield each company with its source file bytes, reading the next company's files while this one is processed.
+
+    The look-ahead is one company, so memory holds a couple of companies' files rather than the whole corpus.
+    """
+    def read_company(company: Dict[str, Any]):
+        return reader.submit(extractor.read_source_files, list(company.get('source_files', {}).values()))
+    
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        next_read = read_company(companies[0]) if companies else None
+        for index, company in enumerate(companies):
+            read = next_read
+            next_read = read_company(companies[index + 1]) if index + 1 < len(companies) else None
+            yield company, read.result()
 
 def debug_source_extraction():
     """Debug source text extraction for troubleshooting"""
@@ -23,8 +57,26 @@ def debug_source_extraction():
     print("🔍 DEBUGGING SOURCE TEXT EXTRACTION")
     print("="*60)
     
-    # Test each company
-    for company in config['companies']:
+    # Lowercase the shared terms once, not per company or per lookup
+    lowered_base_searches = [
+        (search_type, [(term, term.lower()) for term in terms])
+        for search_type, terms in _TEST_SEARCHES
+    ]
+    
+    # Aho-Corasick automaton over the shared terms, built once and reused for every company
+    base_automaton = None
+    if ahocorasick is not None:
+        base_automaton = ahocorasick.Automaton()
+        for search_type, terms in lowered_base_searches:
+            for term, term_lower in terms:
+                if term_lower:
+                    pairs = base_automaton.get(term_lower, [])
+                    pairs.append((search_type, term))
+                    base_automaton.add_word(term_lower, pairs)
+        base_automaton.make_automaton()
+    
+    # Test each company (its source files are read while the previous company is processed)
+    for company, file_cache in _with_prefetched_files(extractor, config['companies']):
         company_name = company['name']
         print(f"\n📊 Testing {company_name}:")
         print("-" * 40)
@@ -34,55 +86,72 @@ def debug_source_extraction():
             continue
         
         # Process source files
-        source_data = extractor.process_source_files(company['source_files'])
+        source_data = extractor.process_source_files(company['source_files'], file_cache=file_cache)
         combined_text = source_data.get('combined_source_text', '')
         
-        print(f"📄 Combined source text length: {len(combined_text):,} characters")
+        # Collect this company's report and write it in one call instead of a print per line
+        report = []
+        
+        report.append(f"📄 Combined source text length: {len(combined_text):,} characters")
         
         if len(combined_text) > 0:
             # Show first 1000 characters
-            print(f"\n📝 First 1000 characters:")
-            print("-" * 30)
-            print(combined_text[:1000])
-            print("-" * 30)
+            report.append(f"\n📝 First 1000 characters:")
+            report.append("-" * 30)
+            report.append(combined_text[:1000])
+            report.append("-" * 30)
             
             # Extract and show key information
             key_info = extractor.extract_key_information(combined_text)
-            print(f"\n🔍 Key Information Extracted:")
+            report.append(f"\n🔍 Key Information Extracted:")
             for category, items in key_info.items():
                 if items:
-                    print(f"  {category}: {len(items)} items")
+                    report.append(f"  {category}: {len(items)} items")
                     for item in items[:3]:  # Show first 3 items
-                        print(f"    - {item}")
+                        report.append(f"    - {item}")
             
             # Test specific searches for this company
-            print(f"\n🔎 Searching for specific information:")
+            report.append(f"\n🔎 Searching for specific information:")
             
-            # Test searches
-            test_searches = [
-                ('company_name', ['brightband', 'company name', company_name.lower()]),
-                ('industry', ['industry', 'sector', 'media', 'information services']),
-                ('location', ['san francisco', 'location', 'based', 'headquarters']),
-                ('founders', ['julian green', 'founder', 'ceo', 'green']),
-                ('funding', ['series a', '$10', 'million', 'raised', 'prelude']),
-                ('valuation', ['$38', 'valuation', 'post-money', '38 million'])
+            # Test searches: the shared terms plus this company's name
+            company_term = company_name.lower()
+            lowered_searches = [
+                (search_type, terms + [(company_term, company_term)] if search_type == 'company_name' else terms)
+                for search_type, terms in lowered_base_searches
             ]
             
-            for search_type, terms in test_searches:
+            # Lowercase the text once, not per lookup
+            hay = combined_text.lower()
+            
+            # Find every shared term in a single pass over the lowercased text; the company name is one extra lookup
+            found_pairs = None
+            if base_automaton is not None:
+                found_pairs = set()
+                for _, pairs in base_automaton.iter(hay):
+                    found_pairs.update(pairs)
+                if company_term in hay:
+                    found_pairs.add(('company_name', company_term))
+            
+            for search_type, terms in lowered_searches:
                 found_terms = []
-                for term in terms:
-                    if term.lower() in combined_text.lower():
+                for term, term_lower in terms:
+                    if found_pairs is not None:
+                        if (search_type, term) in found_pairs or not term_lower:
+                            found_terms.append(term)
+                    elif term_lower in hay:
                         found_terms.append(term)
                 
                 if found_terms:
-                    print(f"  ✅ {search_type}: Found {found_terms}")
+                    report.append(f"  ✅ {search_type}: Found {found_terms}")
                 else:
-                    print(f"  ❌ {search_type}: Not found")
+                    report.append(f"  ❌ {search_type}: Not found")
         
         else:
-            print("❌ No source text extracted!")
+            report.append("❌ No source text extracted!")
             
-        print(f"\n{'='*60}")
+        report.append(f"\n{'='*60}")
+        sys.stdout.write('\n'.join(report) + '\n')
 
 if __name__ == "__main__":
+    configure_logging(verbose=any(arg in ('--verbose', '-v') for arg in sys.argv[1:]))
     debug_source_extraction()
\ No newline at end of file
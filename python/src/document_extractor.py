@@ -1,36 +1,333 @@
-import PyPDF2
 import fitz  # PyMuPDF
-import pytesseract
 from PIL import Image
-from pdf2image import convert_from_path
-from pptx import Presentation
 import json
+import logging
 import os
 import io
-import cv2
-import numpy as np
-from typing import Dict, List, Any, Optional
+import contextlib
+import sys
+from typing import Dict, List, Any, NamedTuple, Optional, Set, Tuple, Iterator, Union
 import re
+import functools
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
 
-class DocumentExtractor:
+# Optional: linear-time RE2 engine for the key information scan
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Optional: Aho-Corasick automata for the section header keyword checks
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: faster JSON encoding of the saved extraction summaries
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: in-process Tesseract binding, so OCR does not spawn a tesseract process per image
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+# Per-page, per-image and per-slide diagnostics go through this logger (progress at DEBUG, problems at
+# WARNING) with lazy %-formatting; per-document summaries are still printed
+logger = logging.getLogger(__name__)
+
+class _StdoutHandler(logging.StreamHandler):
+    """Stream handler bound to whatever sys.stdout is at emit time, so log lines stay in order with
+    print output and are captured along with it in source file workers"""
+    
     def __init__(self):
+        super().__init__(sys.stdout)
+    
+    @property
+    def stream(self):
+        return sys.stdout
+    
+    @stream.setter
+    def stream(self, value):
+        pass
+
+def configure_logging(verbose: bool = False) -> None:
+    """Send diagnostics to stdout as plain lines; per-page and per-image progress only when verbose"""
+    logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[_StdoutHandler()])
+    # Only this module's progress turns verbose; HTTP client libraries stay at INFO
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+# Source files are read in one concurrent batch rather than opened one by one
+MAX_READ_WORKERS = 8
+MAX_SOURCE_FILE_BYTES = 100 * 1024 * 1024
+
+# Two or more source files are extracted side by side, one worker process per file
+MAX_SOURCE_FILE_WORKERS = 4
+
+# Large PDFs are split into blocks of pages extracted in worker processes
+MIN_PAGES_FOR_PARALLEL = 8
+PAGES_PER_WORKER_BLOCK = 10
+MAX_PDF_WORKERS = 6
+
+# Within a process, OCR runs on worker threads while pages keep being decoded; at most
+# MAX_PENDING_OCR_IMAGES decoded images wait for OCR at a time
+MAX_OCR_WORKERS = 4
+MAX_PENDING_OCR_IMAGES = 16
+
+# Key information patterns, compiled once and reused for every document
+_COMPANY_PATTERNS = [re.compile(p, re.MULTILINE | re.IGNORECASE) for p in (
+    r'(?:Company|Business|Startup|Firm|Corporation)[:\s]+([^\n,.]{3,50})',
+    r'([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]*)*)\s*[|\-|•]\s*(?:Private|Company|Profile)',
+    r'(?:^|\n)([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]*)*)\s*(?:\||Private Company Profile)',
+    r'(?:^|\n)([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]*)*)\s*(?:Inc\.|LLC|Corp\.|Ltd\.)'
+)]
+_FINANCIAL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\$[\d,]+(?:\.\d+)?[MBK]?(?:\s*(?:million|billion|thousand))?',
+    r'(?:valuation|raised|funding|investment|revenue)[:\s]*\$[\d,]+(?:\.\d+)?[MBK]?',
+    r'(?:Series [A-Z]|Seed|Pre-seed|Growth)(?:\s+(?:funding|round|investment))?',
+    r'(?:pre-money|post-money)[:\s]*\$[\d,]+(?:\.\d+)?[MBK]?',
+    r'(?:ARR|MRR|revenue)[:\s]*\$[\d,]+(?:\.\d+)?[MBK]?'
+)]
+_PEOPLE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:CEO|CTO|CFO|Founder|Co-Founder|Chief|President|Director)[:\s]*([A-Z][a-zA-Z\s]+)',
+    r'([A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+)(?:\s*-?\s*(?:CEO|CTO|CFO|Founder|Co-Founder))',
+    r'(?:Founded by|Led by|Team)[:\s]*([A-Z][a-zA-Z\s,]+)',
+    r'([A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+),?\s*(?:CEO|CTO|CFO|Founder)'
+)]
+_LOCATION_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:located|based|headquarters|office|address)[:\s]*([A-Z][a-zA-Z\s,]+(?:CA|NY|TX|FL|USA|United States))',
+    r'([A-Z][a-zA-Z]+,\s*[A-Z]{2}(?:,\s*(?:USA|United States))?)',
+    r'(?:San Francisco|New York|Los Angeles|Boston|Seattle|Austin|Chicago|Miami|Palo Alto),?\s*[A-Z]{2}?',
+    r'(?:California|New York|Texas|Florida|Massachusetts|Washington|Illinois),?\s*USA?'
+)]
+_YEAR_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:founded|established|started|incorporated|year)[:\s]*(\d{4})',
+    r'(\d{4})(?:\s*-\s*(?:founded|established|started))',
+    r'(?:as of|dated?)[:\s]*(\d{1,2}[-/]\d{1,2}[-/]\d{4})',
+    r'(?:since|from)\s*(\d{4})'
+)]
+_INDUSTRY_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:industry|sector|market|vertical)[:\s]*([A-Z][a-zA-Z\s&,]+)',
+    r'(?:AI|Artificial Intelligence|Machine Learning|Software|Technology|Healthcare|Fintech|Biotech|SaaS)',
+    r'(?:Media and Information Services|Business Software|Enterprise|B2B|B2C)',
+    r'(?:EdTech|PropTech|HealthTech|CleanTech|FoodTech|RetailTech)'
+)]
+
+# With RE2 the key information patterns run as DFAs over the UTF-8 bytes. Python's \s, \d and
+# case-insensitive [A-Z] also match a few non-ASCII characters that RE2's do not (plus \v and
+# \x1c-\x1f for \s), so text containing any of them is scanned with re instead
+_RE2_UNSAFE_CHARS_PAT = re.compile(r'[\v\x1c-\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\u0130\u0131\u017f\u212a]|[^\x00-\x7f](?<=\d)')
+_RE2_KEY_PATTERNS = {
+    pattern: re2.compile((('(?im)' if pattern.flags & re.MULTILINE else '(?i)') + pattern.pattern).encode())
+    for pattern in (*_COMPANY_PATTERNS, *_FINANCIAL_PATTERNS, *_PEOPLE_PATTERNS,
+                    *_LOCATION_PATTERNS, *_YEAR_PATTERNS, *_INDUSTRY_PATTERNS)
+} if re2 is not None else {}
+
+# Text cleanup patterns
+# Page text cleaning works on the whole text at once: bullet prefixes (a bullet symbol, or '-'/'*' followed
+# by whitespace, plus any further bullet symbols and spaces) become '• ', whitespace runs within a line
+# collapse to one space and blank lines are dropped (the patterns only match where something changes)
+_BULLET_PREFIX_PAT = re.compile(r'^[^\S\n]*(?:[•·▪▫◦‣⁃]|[-*][^\S\n])(?:[^\S\n]|[•·▪▫◦‣⁃*-])*', re.MULTILINE)
+_INLINE_WHITESPACE_PAT = re.compile(r' [^\S\n]+|[^\S\n ][^\S\n]*')
+_LINE_BREAKS_PAT = re.compile(r'(?: \n|\n[ \n])[ \n]*')
+_BARE_BULLET_PAT = re.compile(r'^•$', re.MULTILINE)
+_EXCESS_BLANK_LINES_PAT = re.compile(r'\n\s*\n\s*\n+')
+
+# Words that mark a line as a possible section header, and the full header phrases a two-line header can form
+_SECTION_HEADER_INDICATORS = (
+    'executive', 'summary', 'company', 'information', 'startup', 'stage',
+    'deal', 'management', 'team', 'metrics', 'customer', 'problem',
+    'product', 'service', 'investment', 'themes', 'market', 'overview',
+    'competitors', 'competitive', 'advantage', 'considerations', 'risk', 'factors'
+)
+_KNOWN_SECTION_HEADERS = (
+    'executive summary',
+    'company information', 
+    'startup stage',
+    'deal summary',
+    'management team',
+    'key metrics',
+    'customer problem',
+    'product and service summary',
+    'product service summary',
+    'investment themes',
+    'market overview',
+    'list of competitors',
+    'competitive advantage summary',
+    'investment considerations risk factors',
+    'investment considerations & risk factors'
+)
+
+# Header phrases that always start a new section while a section's content is being collected,
+# searched in one pass as a single alternation
+_DEFINITE_SECTION_STARTS = (
+    'executive summary', 'company information', 'startup stage',
+    'deal summary', 'management team', 'key metrics',
+    'customer problem', 'product and service summary',
+    'investment themes', 'market overview', 'list of competitors',
+    'competitive advantage summary', 'investment considerations'
+)
+_DEFINITE_SECTION_PAT = re.compile('|'.join(re.escape(section) for section in _DEFINITE_SECTION_STARTS))
+
+# Characters dropped from a memo line before the exact header lookup
+_NON_HEADER_CHARS_PAT = re.compile(r'[^\w\s&]')
+# The same characters within ASCII, for deleting them from ASCII lines with one bytes.translate call
+_NON_HEADER_ASCII_BYTES = bytes(c for c in range(128) if _NON_HEADER_CHARS_PAT.match(chr(c)))
+
+# Every pattern from _create_comprehensive_section_patterns contains one of these words literally, so a
+# lowercase ASCII line without any of them cannot match a pattern (a cheap check before the full patterns)
+_SECTION_ANCHOR_PAT = re.compile(
+    r'summary|overview|company|stage|team|founders|personnel|metrics|kpi|problem|challenges|pain|'
+    r'solution|offering|themes|thesis|analysis|opportunity|competit|differentiation|risk'
+)
+
+# Cleaned header lines that name a memo section exactly (detected with confidence 100)
+_EXACT_SECTION_HEADERS = {
+    "executive summary": "executive_summary",
+    "company information": "company_information", 
+    "startup stage": "startup_stage",
+    "deal summary": "deal_summary",
+    "management team": "management_team",
+    "key metrics": "key_metrics",
+    "customer problem": "customer_problem",
+    "product and service summary": "product_service_summary",
+    "product service summary": "product_service_summary",
+    "investment themes": "investment_themes",
+    "market overview": "market_overview",
+    "list of competitors": "list_of_competitors",
+    "competitive advantage summary": "competitive_advantage_summary",
+    "investment considerations & risk factors": "investment_considerations_risk_factors",
+    "investment considerations risk factors": "investment_considerations_risk_factors"
+}
+
+class SectionHit(NamedTuple):
+    """Where a memo section header was detected, and how confidently"""
+    line_num: int
+    line_text: str
+    match_type: str
+    confidence: int
+    clean_text: str
+
+def _to_indented_json(data: Any) -> bytes:
+    """UTF-8 JSON with 2-space indentation and non-ASCII text kept as-is (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _write_file_atomic(file_path: str, content: bytes) -> None:
+    """Write content in one call to a temporary file beside file_path, then rename it into place"""
+    tmp_file = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_file, file_path)
+    except OSError:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+@functools.lru_cache(maxsize=None)
+def _compile_section_pattern(pattern: str) -> re.Pattern:
+    """Compile a section header pattern once, however many lines and memos it is matched against"""
+    return re.compile(pattern, re.IGNORECASE)
+
+def _build_keyword_automaton(keywords: Tuple[str, ...]):
+    """Aho-Corasick automaton over keywords, so one scan of a line finds whether any of them occurs"""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_SECTION_HEADER_AUTOMATON = _build_keyword_automaton(_SECTION_HEADER_INDICATORS) if ahocorasick is not None else None
+_KNOWN_HEADER_AUTOMATON = _build_keyword_automaton(_KNOWN_SECTION_HEADERS) if ahocorasick is not None else None
+
+# Keywords scoring paragraphs for sections the header scan missed (frozensets, so a paragraph's score is one
+# intersection with the keywords found in it); one automaton over all of them finds every keyword in a single pass
+_FUZZY_SECTION_KEYWORDS = {
+    "executive_summary": frozenset(("executive", "summary", "overview", "brief")),
+    "company_information": frozenset(("company", "business", "organization", "firm")),
+    "startup_stage": frozenset(("stage", "funding", "round", "series")),
+    "deal_summary": frozenset(("deal", "transaction", "investment", "funding")),
+    "management_team": frozenset(("team", "management", "leadership", "founders", "ceo", "cto")),
+    "key_metrics": frozenset(("metrics", "kpi", "performance", "financial", "revenue")),
+    "customer_problem": frozenset(("problem", "challenge", "pain", "issue", "customer")),
+    "product_service_summary": frozenset(("product", "service", "solution", "offering")),
+    "investment_themes": frozenset(("investment", "themes", "thesis", "rationale")),
+    "market_overview": frozenset(("market", "industry", "sector", "opportunity")),
+    "list_of_competitors": frozenset(("competitors", "competition", "competitive")),
+    "competitive_advantage_summary": frozenset(("advantage", "differentiation", "unique")),
+    "investment_considerations_risk_factors": frozenset(("risk", "considerations", "factors", "challenges"))
+}
+_FUZZY_KEYWORDS = tuple(dict.fromkeys(keyword for keywords in _FUZZY_SECTION_KEYWORDS.values() for keyword in keywords))
+_FUZZY_KEYWORD_AUTOMATON = _build_keyword_automaton(_FUZZY_KEYWORDS) if ahocorasick is not None else None
+
+# OCR results persist across runs in ocr/ under this directory (None keeps them in memory only),
+# keyed by a hash of the image pixels and the Tesseract settings
+CACHE_DIR = 'data/cache'
+OCR_CONFIG = '--psm 6'
+
+# Embedded images too small or too elongated to hold readable text (spacers, rules, gradients) are not OCRed
+MIN_OCR_IMAGE_SIDE = 60
+MIN_OCR_IMAGE_AREA = 10_000
+MAX_OCR_IMAGE_ASPECT = 20
+
+# Images whose pixel values barely vary (standard deviation below this) are blank fills, not text
+MIN_OCR_IMAGE_STD = 5.0
+
+# Images are binarized (Otsu) and deskewed before OCR; skew beyond MAX_DESKEW_ANGLE degrees is
+# taken to be a figure or photo rather than tilted text and left alone
+PREPROCESS_OCR_IMAGES = True
+MIN_DESKEW_ANGLE = 0.5
+MAX_DESKEW_ANGLE = 10
+
+# The tesserocr fallback is reported once per process, however many extractors and OCR threads hit it
+_tess_warning_lock = threading.Lock()
+_tess_warning_issued = False
+
+def _warn_tess_unavailable(error: Exception) -> None:
+    """Log the first tesserocr failure in this process; later failures fall back silently"""
+    global _tess_warning_issued
+    with _tess_warning_lock:
+        if _tess_warning_issued:
+            return
+        _tess_warning_issued = True
+    logger.warning("            ⚠️ In-process OCR unavailable, using pytesseract: %s", error)
+
+class DocumentExtractor:
+    # Output directories already created in this process (absolute paths), so saves skip the makedirs syscalls
+    _ensured_dirs: Set[str] = set()
+    
+    def __init__(self, cache_dir: str = CACHE_DIR):
         self.extracted_data = {}
+        self._tess_local = threading.local()  # per-thread tesserocr handles (PyTessBaseAPI is not thread-safe)
+        self._tess_disabled = False  # set once tesserocr turns out to be unusable
+        
+        # OCR text keyed by image content, so repeated logos/figures and re-runs skip Tesseract
+        self._ocr_cache = {}
+        self.cache_dir = cache_dir
+        # Created on the first cache write, so constructing an extractor never adds directories
+        self.ocr_cache_dir = os.path.join(cache_dir, 'ocr') if cache_dir else None
     
-    def extract_pdf_text(self, pdf_path: str, source_file_type: str = "unknown") -> Dict[str, Any]:
+    def extract_pdf_text(self, pdf_path: str, source_file_type: str = "unknown", file_bytes: Optional[bytes] = None) -> Dict[str, Any]:
         """Enhanced PDF text extraction with source file tracking and better error handling"""
         try:
-            # Open document with error handling
+            # Open document with error handling (from prefetched bytes when available)
             try:
-                doc = fitz.open(pdf_path)
+                if file_bytes is not None:
+                    doc = fitz.open(stream=file_bytes, filetype="pdf")
+                else:
+                    doc = fitz.open(pdf_path)
             except Exception as e:
                 print(f"         ❌ Cannot open PDF: {e}")
                 return self._create_error_result(pdf_path, source_file_type, f"Cannot open PDF: {e}")
             
-            full_text = ""
-            images_text = ""
-            structured_content = []
-            
             # Get page count
             page_count = len(doc)
             if page_count == 0:
@@ -40,82 +337,27 @@ class DocumentExtractor:
             
             print(f"         📖 Processing {page_count} pages...")
             
-            for page_num in range(page_count):
-                try:
-                    page = doc.load_page(page_num)
-                    
-                    # ENHANCED: Extract text with better formatting preservation
-                    text = page.get_text()
-                    
-                    # IMPROVED: Also try to get text with layout information
-                    try:
-                        text_dict = page.get_text("dict")
-                        layout_text = self._extract_text_with_layout(text_dict)
-                        if layout_text and len(layout_text) > len(text):
-                            text = layout_text
-                    except Exception as layout_error:
-                        print(f"            ⚠️ Layout extraction failed for page {page_num + 1}: {layout_error}")
-                    
-                    if text.strip():  # Only add non-empty pages
-                        # ENHANCED: Include source file type in page header
-                        page_header = f"\n{'='*50}\nSOURCE_FILE: {source_file_type.upper()}\nPAGE {page_num + 1}\n{'='*50}\n"
-                        
-                        # IMPROVED: Better text cleaning and preservation
-                        cleaned_text = self._clean_and_preserve_text(text)
-                        full_text += page_header + cleaned_text + "\n"
-                        
-                        # Try to structure the content better
-                        structured_content.append({
-                            'source_file': source_file_type,
-                            'page': page_num + 1,
-                            'content': cleaned_text,
-                            'length': len(cleaned_text)
-                        })
-                    
-                    # Extract images and perform OCR with better error handling
-                    try:
-                        image_list = page.get_images()
-                        if image_list:
-                            print(f"            🖼️  Found {len(image_list)} images on page {page_num + 1}")
-                        
-                        for img_index, img in enumerate(image_list):
-                            try:
-                                xref = img[0]
-                                pix = fitz.Pixmap(doc, xref)
-                                
-                                # Check if it's a suitable image for OCR
-                                if pix.n - pix.alpha < 4:  # GRAY or RGB
-                                    img_data = pix.tobytes("png")
-                                    img_pil = Image.open(io.BytesIO(img_data))
-                                    
-                                    # Perform OCR on the image with timeout protection
-                                    try:
-                                        ocr_text = pytesseract.image_to_string(img_pil, config='--psm 6')
-                                        if ocr_text.strip():  # Only add if OCR found text
-                                            # ENHANCED: Include source file in OCR header
-                                            ocr_header = f"\n[OCR from {source_file_type.upper()}: Page {page_num + 1}, Image {img_index + 1}]\n"
-                                            images_text += ocr_header + ocr_text + "\n"
-                                    except Exception as ocr_error:
-                                        print(f"            ⚠️ OCR failed for image {img_index + 1}: {ocr_error}")
-                                    
-                                    # Clean up PIL image
-                                    img_pil.close()
-                                
-                                # Clean up pixmap immediately
-                                pix = None
-                                
-                            except Exception as img_error:
-                                print(f"            ⚠️ Error processing image {img_index + 1} on page {page_num + 1}: {img_error}")
-                                continue
-                    except Exception as images_error:
-                        print(f"            ⚠️ Error processing images on page {page_num + 1}: {images_error}")
-                    
-                    # Clean up page reference
-                    page = None
-                    
-                except Exception as page_error:
-                    print(f"         ⚠️ Error processing page {page_num + 1}: {page_error}")
-                    continue
+            # Large PDFs are extracted in blocks of pages across worker processes (OCR is CPU-bound)
+            page_results = None
+            if page_count >= MIN_PAGES_FOR_PARALLEL:
+                page_results = self._extract_pdf_pages_parallel(pdf_path, page_count, source_file_type)
+            if page_results is None:
+                ocr_workers = min(MAX_OCR_WORKERS, os.cpu_count() or 1)
+                page_results = self._extract_pdf_pages(doc, range(page_count), source_file_type, ocr_workers)
+            
+            # Stitch pages back together in page order
+            full_text = "".join(page_text for page_text, _, _ in page_results)
+            images_text = "".join(page_ocr_text for _, page_ocr_text, _ in page_results)
+            
+            # Page entries point into full_text instead of holding a second copy of each page
+            structured_content = []
+            offset = 0
+            for page_text, _, entry in page_results:
+                if entry is not None:
+                    entry['start'] += offset
+                    entry['end'] += offset
+                    structured_content.append(entry)
+                offset += len(page_text)
             
             # Close document properly
             doc.close()
@@ -148,33 +390,321 @@ class DocumentExtractor:
             print(f"         ❌ Error extracting PDF text from {os.path.basename(pdf_path)}: {e}")
             return self._create_error_result(pdf_path, source_file_type, str(e))
     
+    def _extract_pdf_pages(self, doc, page_nums: range, source_file_type: str,
+                           ocr_workers: int = 1) -> List[Tuple[str, str, Optional[Dict[str, Any]]]]:
+        """Extract PDF pages in order; with several OCR workers, images are OCRed on threads while later pages decode"""
+        xref_ocr = {}  # images repeated across pages (logos) are decoded and OCRed once per document
+        
+        if ocr_workers < 2:
+            pages = [self._extract_pdf_page(doc, page_num, source_file_type, xref_ocr) for page_num in page_nums]
+        else:
+            # Only this thread touches the document; the pool just runs OCR on already decoded images
+            with ThreadPoolExecutor(max_workers=ocr_workers) as ocr_pool:
+                ocr_slots = threading.BoundedSemaphore(MAX_PENDING_OCR_IMAGES)
+                pages = [self._extract_pdf_page(doc, page_num, source_file_type, xref_ocr, ocr_pool, ocr_slots)
+                         for page_num in page_nums]
+        
+        # Assemble the OCR text in page and image order
+        return [(page_text, self._format_page_ocr(page_num, source_file_type, ocr_results), structured)
+                for page_num, (page_text, ocr_results, structured) in zip(page_nums, pages)]
+    
+    def _format_page_ocr(self, page_num: int, source_file_type: str,
+                         ocr_results: List[Tuple[int, Union[str, None, Future]]]) -> str:
+        """Build a page's OCR text from its (image index, OCR text or pending OCR) entries"""
+        page_ocr_parts = []
+        for img_index, ocr_text in ocr_results:
+            if isinstance(ocr_text, Future):
+                ocr_text = ocr_text.result()
+            
+            if ocr_text and ocr_text.strip():  # Only add if OCR found text
+                # ENHANCED: Include source file in OCR header
+                ocr_header = f"\n[OCR from {source_file_type.upper()}: Page {page_num + 1}, Image {img_index + 1}]\n"
+                page_ocr_parts.append(ocr_header + ocr_text + "\n")
+        
+        return "".join(page_ocr_parts)
+    
+    def _extract_pdf_page(self, doc, page_num: int, source_file_type: str,
+                          xref_ocr: Dict[int, Union[str, None, Future]],
+                          ocr_pool: Optional[ThreadPoolExecutor] = None,
+                          ocr_slots: Optional[threading.Semaphore] = None) -> Tuple[str, List[Tuple[int, Union[str, None, Future]]], Optional[Dict[str, Any]]]:
+        """Extract one PDF page: its text, its (image index, OCR text) entries and its structured entry (None for empty pages)
+        
+        xref_ocr maps image xrefs already seen in this document to their OCR text (None: not OCRed).
+        With an ocr_pool, OCR is submitted to it and the entries hold futures.
+        """
+        page_text = ""
+        ocr_results = []
+        structured = None
+        
+        try:
+            page = doc.load_page(page_num)
+            
+            # One text analysis of the page serves both the plain and the layout extraction
+            # (image blocks are not collected; the layout pass only reads text lines)
+            textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
+            
+            # ENHANCED: Extract text with better formatting preservation
+            text = page.get_text(textpage=textpage)
+            
+            # IMPROVED: Also try to get text with layout information
+            try:
+                text_dict = page.get_text("dict", textpage=textpage)
+                layout_text = self._extract_text_with_layout(text_dict)
+                if layout_text and len(layout_text) > len(text):
+                    text = layout_text
+            except Exception as layout_error:
+                logger.warning("            ⚠️ Layout extraction failed for page %d: %s", page_num + 1, layout_error)
+            
+            if text.strip():  # Only add non-empty pages
+                # ENHANCED: Include source file type in page header
+                page_header = f"\n{'='*50}\nSOURCE_FILE: {source_file_type.upper()}\nPAGE {page_num + 1}\n{'='*50}\n"
+                
+                # IMPROVED: Better text cleaning and preservation
+                cleaned_text = self._clean_and_preserve_text(text)
+                page_text += page_header + cleaned_text + "\n"
+                
+                # Try to structure the content better (offsets into page_text; shifted into full_text by the caller)
+                structured = {
+                    'source_file': source_file_type,
+                    'page': page_num + 1,
+                    'start': len(page_header),
+                    'end': len(page_header) + len(cleaned_text),
+                    'length': len(cleaned_text)
+                }
+            
+            # Extract images and perform OCR with better error handling
+            try:
+                image_list = page.get_images()
+                if image_list:
+                    logger.debug("            🖼️  Found %d images on page %d", len(image_list), page_num + 1)
+                
+                for img_index, img in enumerate(image_list):
+                    try:
+                        xref = img[0]
+                        
+                        # Skip spacers, rules and gradients from the image's declared size, before decoding it
+                        if not self._is_ocr_candidate_size(img[2], img[3]):
+                            continue
+                        
+                        # Images repeated across pages are decoded and OCRed only on their first occurrence
+                        if xref in xref_ocr:
+                            ocr_text = xref_ocr[xref]
+                        else:
+                            ocr_text = None
+                            pix = fitz.Pixmap(doc, xref)
+                            
+                            # Check if it's a suitable image for OCR (GRAY or RGB, not a blank fill)
+                            if pix.n - pix.alpha < 4 and not self._is_blank_image(pix):
+                                # Reuse the OCR text of identical pixels before encoding and OCRing the image
+                                ocr_key = self._ocr_cache_key(pix)
+                                ocr_text = self._get_cached_ocr(ocr_key)
+                                
+                                if ocr_text is None:
+                                    img_pil = self._pixmap_to_image(pix)
+                                    
+                                    if ocr_pool is None:
+                                        ocr_text = self._ocr_and_cache(img_pil, ocr_key, img_index)
+                                    else:
+                                        # Wait for a free slot so decoded images don't pile up ahead of OCR
+                                        ocr_slots.acquire()
+                                        ocr_text = ocr_pool.submit(self._ocr_and_cache, img_pil, ocr_key, img_index)
+                                        ocr_text.add_done_callback(lambda _: ocr_slots.release())
+                            
+                            # Clean up pixmap immediately
+                            pix = None
+                            xref_ocr[xref] = ocr_text
+                        
+                        ocr_results.append((img_index, ocr_text))
+                        
+                    except Exception as img_error:
+                        logger.warning("            ⚠️ Error processing image %d on page %d: %s", img_index + 1, page_num + 1, img_error)
+                        continue
+            except Exception as images_error:
+                logger.warning("            ⚠️ Error processing images on page %d: %s", page_num + 1, images_error)
+            
+            # Clean up page references
+            textpage = None
+            page = None
+            
+        except Exception as page_error:
+            logger.warning("         ⚠️ Error processing page %d: %s", page_num + 1, page_error)
+        
+        return page_text, ocr_results, structured
+    
+    @staticmethod
+    def _is_ocr_candidate_size(width: int, height: int) -> bool:
+        """Whether an embedded image is large enough, and not too elongated, to hold readable text"""
+        if width < MIN_OCR_IMAGE_SIDE or height < MIN_OCR_IMAGE_SIDE or width * height < MIN_OCR_IMAGE_AREA:
+            return False
+        return max(width, height) <= MAX_OCR_IMAGE_ASPECT * min(width, height)
+    
+    @staticmethod
+    def _pixmap_to_image(pix) -> Image.Image:
+        """Wrap a GRAY/RGB pixmap's raw samples as a PIL image (the same pixels a PNG round-trip would give)"""
+        mode = ('L', 'RGB')[pix.n - pix.alpha == 3] + ('A' if pix.alpha else '')
+        return Image.frombytes(mode, (pix.width, pix.height), pix.samples, 'raw', mode, pix.stride)
+    
+    @staticmethod
+    def _is_blank_image(pix) -> bool:
+        """Whether a pixmap is a (near) solid fill: its sample values barely vary"""
+        import numpy as np  # imported on first use, like the other OCR-only dependencies
+        
+        # Per channel, so a solid colour (interleaved R, G, B samples) counts as blank
+        samples = np.frombuffer(pix.samples, dtype=np.uint8)[:pix.width * pix.height * pix.n].reshape(-1, pix.n)
+        return float(samples.std(axis=0).max()) < MIN_OCR_IMAGE_STD
+    
+    def _ocr_and_cache(self, img_pil: Image.Image, ocr_key: str, img_index: int) -> Optional[str]:
+        """OCR a decoded image and cache the text; None when OCR fails (the image is closed either way)"""
+        # Perform OCR on the image with timeout protection
+        try:
+            if PREPROCESS_OCR_IMAGES:
+                img_pil = self._preprocess_for_ocr(img_pil)
+            ocr_text = self._ocr_image(img_pil)
+            self._store_cached_ocr(ocr_key, ocr_text)
+            return ocr_text
+        except Exception as ocr_error:
+            logger.warning("            ⚠️ OCR failed for image %d: %s", img_index + 1, ocr_error)
+            return None
+        finally:
+            # Clean up PIL image
+            img_pil.close()
+    
+    def _preprocess_for_ocr(self, img_pil: Image.Image) -> Image.Image:
+        """Binarize an image with Otsu's threshold and straighten slightly tilted text"""
+        # Imported on first use: OpenCV is slow to load and only needed once an image is OCRed
+        import cv2
+        import numpy as np
+        
+        gray = np.asarray(img_pil.convert('L'))
+        img_pil.close()
+        _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        
+        # The dark (ink) pixels' minimum-area rectangle gives the skew of the text block
+        ink = cv2.findNonZero(255 - bw)
+        if ink is not None:
+            angle = cv2.minAreaRect(ink)[-1]
+            if angle > 45:
+                angle -= 90
+            elif angle < -45:
+                angle += 90
+            
+            if MIN_DESKEW_ANGLE < abs(angle) <= MAX_DESKEW_ANGLE:
+                height, width = bw.shape
+                rotation = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+                bw = cv2.warpAffine(bw, rotation, (width, height), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE)
+        
+        return Image.fromarray(bw)
+    
+    def _ocr_image(self, img_pil: Image.Image) -> str:
+        """OCR one image (--psm 6), reusing an in-process Tesseract handle per thread when tesserocr is installed"""
+        if tesserocr is not None and not self._tess_disabled:
+            try:
+                tess_api = getattr(self._tess_local, 'api', None)
+                if tess_api is None:
+                    tess_api = self._tess_local.api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK)
+                tess_api.SetImage(img_pil)
+                return tess_api.GetUTF8Text()
+            except Exception as e:
+                self._tess_disabled = True
+                _warn_tess_unavailable(e)
+        
+        import pytesseract  # imported on first use, like the other OCR-only dependencies
+        return pytesseract.image_to_string(img_pil, config=OCR_CONFIG)
+    
+    def _ocr_cache_key(self, pix) -> str:
+        """Hash the raw pixels (no PNG encode) together with their shape and the OCR settings"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{pix.width}x{pix.height}x{pix.n}:{OCR_CONFIG}:{PREPROCESS_OCR_IMAGES}:".encode())
+        digest.update(pix.samples)
+        return digest.hexdigest()
+    
+    def _get_cached_ocr(self, cache_key: str) -> Optional[str]:
+        """Look up OCR text in memory, then on disk"""
+        if cache_key in self._ocr_cache:
+            return self._ocr_cache[cache_key]
+        
+        if self.ocr_cache_dir:
+            cache_file = os.path.join(self.ocr_cache_dir, f"{cache_key}.json")
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    ocr_text = json.load(f)['ocr_text']
+                self._ocr_cache[cache_key] = ocr_text
+                return ocr_text
+            except (OSError, ValueError, KeyError):
+                pass
+        
+        return None
+    
+    def _store_cached_ocr(self, cache_key: str, ocr_text: str):
+        """Remember OCR text in memory and persist it to the cache directory"""
+        self._ocr_cache[cache_key] = ocr_text
+        
+        if self.ocr_cache_dir:
+            cache_file = os.path.join(self.ocr_cache_dir, f"{cache_key}.json")
+            try:
+                ocr_cache_dir = os.path.abspath(self.ocr_cache_dir)
+                if ocr_cache_dir not in DocumentExtractor._ensured_dirs:
+                    os.makedirs(ocr_cache_dir, exist_ok=True)
+                    DocumentExtractor._ensured_dirs.add(ocr_cache_dir)
+                # Write then rename so an interrupted run (or a parallel worker) never leaves a partial file
+                _write_file_atomic(cache_file, json.dumps({'ocr_text': ocr_text}, ensure_ascii=False).encode('utf-8'))
+            except OSError as e:
+                logger.warning("            ⚠️ Could not write OCR cache: %s", e)
+    
+    def _extract_pdf_pages_parallel(self, pdf_path: str, page_count: int, source_file_type: str) -> Optional[List[Tuple[str, str, Optional[Dict[str, Any]]]]]:
+        """Extract pages in blocks on a process pool; returns None when the sequential path should be used"""
+        max_workers = min(MAX_PDF_WORKERS, os.cpu_count() or 1)
+        if max_workers < 2 or not os.path.exists(pdf_path):
+            return None
+        
+        # Already in a source file worker: files are the unit of parallelism there, so do not nest a second pool
+        if _worker_extractor is self:
+            return None
+        
+        blocks = [range(start, min(start + PAGES_PER_WORKER_BLOCK, page_count))
+                  for start in range(0, page_count, PAGES_PER_WORKER_BLOCK)]
+        
+        try:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(blocks)),
+                                     initializer=_init_pdf_worker, initargs=(self.cache_dir,)) as pool:
+                block_results = pool.map(_extract_pdf_page_block, [pdf_path] * len(blocks), blocks,
+                                         [source_file_type] * len(blocks))
+                return [page for block in block_results for page in block]
+        except Exception as e:
+            print(f"            ⚠️ Parallel page extraction failed, extracting sequentially: {e}")
+            return None
+    
     def _extract_text_with_layout(self, text_dict: Dict) -> str:
         """IMPROVED: Extract text while preserving layout and formatting"""
         try:
-            extracted_text = ""
+            # Text is collected in lists and joined once instead of re-copied per span
+            extracted_parts = []
             
             if "blocks" in text_dict:
                 for block in text_dict["blocks"]:
                     if "lines" in block:
-                        block_text = ""
+                        block_parts = []
                         for line in block["lines"]:
                             if "spans" in line:
-                                line_text = ""
+                                span_parts = []
                                 for span in line["spans"]:
                                     if "text" in span:
                                         text = span["text"]
                                         # Preserve formatting information
                                         if span.get("flags", 0) & 2**4:  # Bold
                                             text = f"**{text}**"
-                                        line_text += text
+                                        span_parts.append(text)
+                                line_text = "".join(span_parts)
                                 if line_text.strip():
-                                    block_text += line_text + "\n"
-                        if block_text.strip():
-                            extracted_text += block_text + "\n"
+                                    block_parts.append(line_text)
+                                    block_parts.append("\n")
+                        if block_parts:  # Only non-blank lines were kept
+                            extracted_parts.extend(block_parts)
+                            extracted_parts.append("\n")
             
-            return extracted_text
+            return "".join(extracted_parts)
         except Exception as e:
-            print(f"            ⚠️ Layout text extraction error: {e}")
+            logger.warning("            ⚠️ Layout text extraction error: %s", e)
             return ""
     
     def _clean_and_preserve_text(self, text: str) -> str:
@@ -182,25 +712,15 @@ class DocumentExtractor:
         if not text:
             return ""
         
-        # Split into lines for processing
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove excessive whitespace but preserve structure
-            cleaned_line = ' '.join(line.split())
-            
-            # Preserve bullet points and list items
-            if cleaned_line:
-                # Detect bullet points and preserve them
-                if re.match(r'^\s*[•·▪▫◦‣⁃]\s*', line) or re.match(r'^\s*[-*]\s+', line):
-                    cleaned_lines.append(f"• {cleaned_line.lstrip('•·▪▫◦‣⁃-* ')}")
-                elif re.match(r'^\s*\d+\.\s+', line):
-                    cleaned_lines.append(cleaned_line)
-                else:
-                    cleaned_lines.append(cleaned_line)
+        # Preserve bullet points and list items under one bullet style
+        text = _BULLET_PREFIX_PAT.sub('• ', text)
+        
+        # Remove excessive whitespace but preserve line structure, dropping blank lines
+        text = _INLINE_WHITESPACE_PAT.sub(' ', text)
+        text = _LINE_BREAKS_PAT.sub('\n', text).strip(' \n')
         
-        return '\n'.join(cleaned_lines)
+        # A bullet with nothing after it keeps its space, as every other bullet line does
+        return _BARE_BULLET_PAT.sub('• ', text)
     
     def _create_error_result(self, file_path: str, source_file_type: str, error_msg: str) -> Dict[str, Any]:
         """Create standardized error result"""
@@ -222,25 +742,25 @@ class DocumentExtractor:
     def create_enhanced_combined_text(self, full_text: str, images_text: str, structured_content: List[Dict]) -> str:
         """Create enhanced combined text with better structure for semantic matching"""
         
-        # Start with key information extraction
-        enhanced_text = "KEY INFORMATION EXTRACTED:\n" + "="*60 + "\n"
+        # Start with key information extraction (parts are joined once at the end)
+        enhanced_parts = ["KEY INFORMATION EXTRACTED:\n" + "="*60 + "\n"]
         
         # Extract key information patterns
         key_info = self.extract_key_information(full_text)
         for category, info in key_info.items():
             if info:
-                enhanced_text += f"\n{category.upper()}:\n"
+                enhanced_parts.append(f"\n{category.upper()}:\n")
                 for item in info[:5]:  # Limit to 5 items per category for token efficiency
-                    enhanced_text += f"- {item}\n"
+                    enhanced_parts.append(f"- {item}\n")
         
-        enhanced_text += "\n" + "="*60 + "\nFULL DOCUMENT CONTENT:\n" + "="*60 + "\n"
-        enhanced_text += full_text
+        enhanced_parts.append("\n" + "="*60 + "\nFULL DOCUMENT CONTENT:\n" + "="*60 + "\n")
+        enhanced_parts.append(full_text)
         
         if images_text.strip():
-            enhanced_text += "\n" + "="*60 + "\nOCR EXTRACTED CONTENT:\n" + "="*60 + "\n"
-            enhanced_text += images_text
+            enhanced_parts.append("\n" + "="*60 + "\nOCR EXTRACTED CONTENT:\n" + "="*60 + "\n")
+            enhanced_parts.append(images_text)
         
-        return enhanced_text
+        return "".join(enhanced_parts)
     
     def extract_key_information(self, text: str) -> Dict[str, List[str]]:
         """Extract key information patterns from text for better semantic matching"""
@@ -258,140 +778,90 @@ class DocumentExtractor:
             return key_info
         
         try:
-            # Company name patterns - improved
-            company_patterns = [
-                r'(?:Company|Business|Startup|Firm|Corporation)[:\s]+([^\n,.]{3,50})',
-                r'([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]*)*)\s*[|\-|•]\s*(?:Private|Company|Profile)',
-                r'(?:^|\n)([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]*)*)\s*(?:\||Private Company Profile)',
-                r'(?:^|\n)([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]*)*)\s*(?:Inc\.|LLC|Corp\.|Ltd\.)'
-            ]
+            # Set per category for the duplicate checks, so they stay O(1) however many matches a document has
+            seen = {category: set() for category in key_info}
             
-            for pattern in company_patterns:
-                try:
-                    matches = re.finditer(pattern, text, re.MULTILINE | re.IGNORECASE)
-                    for match in matches:
-                        company_name = match.group(1).strip()
-                        if len(company_name) > 2 and company_name not in key_info['company_names']:
-                            key_info['company_names'].append(company_name)
-                except Exception as e:
-                    print(f"            ⚠️ Error in company pattern matching: {e}")
-                    continue
+            # Scan the UTF-8 bytes with RE2 when every pattern matches exactly as it would with re
+            text_bytes = None
+            if re2 is not None and not _RE2_UNSAFE_CHARS_PAT.search(text):
+                text_bytes = text.encode()
             
-            # Financial information - improved
-            financial_patterns = [
-                r'\$[\d,]+(?:\.\d+)?[MBK]?(?:\s*(?:million|billion|thousand))?',
-                r'(?:valuation|raised|funding|investment|revenue)[:\s]*\$[\d,]+(?:\.\d+)?[MBK]?',
-                r'(?:Series [A-Z]|Seed|Pre-seed|Growth)(?:\s+(?:funding|round|investment))?',
-                r'(?:pre-money|post-money)[:\s]*\$[\d,]+(?:\.\d+)?[MBK]?',
-                r'(?:ARR|MRR|revenue)[:\s]*\$[\d,]+(?:\.\d+)?[MBK]?'
-            ]
+            # Company name patterns - improved
+            for company_name in self._iter_key_matches(_COMPANY_PATTERNS, text, text_bytes, group=1):
+                company_name = company_name.strip()
+                if len(company_name) > 2 and company_name not in seen['company_names']:
+                    seen['company_names'].add(company_name)
+                    key_info['company_names'].append(company_name)
             
-            for pattern in financial_patterns:
-                try:
-                    matches = re.finditer(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        financial_info = match.group().strip()
-                        if financial_info not in key_info['financial_information']:
-                            key_info['financial_information'].append(financial_info)
-                except Exception as e:
-                    print(f"            ⚠️ Error in financial pattern matching: {e}")
-                    continue
+            # Financial information - improved
+            for financial_info in self._iter_key_matches(_FINANCIAL_PATTERNS, text, text_bytes):
+                financial_info = financial_info.strip()
+                if financial_info not in seen['financial_information']:
+                    seen['financial_information'].add(financial_info)
+                    key_info['financial_information'].append(financial_info)
             
             # People and roles - improved
-            people_patterns = [
-                r'(?:CEO|CTO|CFO|Founder|Co-Founder|Chief|President|Director)[:\s]*([A-Z][a-zA-Z\s]+)',
-                r'([A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+)(?:\s*-?\s*(?:CEO|CTO|CFO|Founder|Co-Founder))',
-                r'(?:Founded by|Led by|Team)[:\s]*([A-Z][a-zA-Z\s,]+)',
-                r'([A-Z][a-zA-Z]+\s+[A-Z][a-zA-Z]+),?\s*(?:CEO|CTO|CFO|Founder)'
-            ]
-            
-            for pattern in people_patterns:
-                try:
-                    matches = re.finditer(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        person_info = match.group().strip()
-                        if len(person_info) > 5 and person_info not in key_info['people_and_roles']:
-                            key_info['people_and_roles'].append(person_info)
-                except Exception as e:
-                    print(f"            ⚠️ Error in people pattern matching: {e}")
-                    continue
+            for person_info in self._iter_key_matches(_PEOPLE_PATTERNS, text, text_bytes):
+                person_info = person_info.strip()
+                if len(person_info) > 5 and person_info not in seen['people_and_roles']:
+                    seen['people_and_roles'].add(person_info)
+                    key_info['people_and_roles'].append(person_info)
             
             # Locations - improved
-            location_patterns = [
-                r'(?:located|based|headquarters|office|address)[:\s]*([A-Z][a-zA-Z\s,]+(?:CA|NY|TX|FL|USA|United States))',
-                r'([A-Z][a-zA-Z]+,\s*[A-Z]{2}(?:,\s*(?:USA|United States))?)',
-                r'(?:San Francisco|New York|Los Angeles|Boston|Seattle|Austin|Chicago|Miami|Palo Alto),?\s*[A-Z]{2}?',
-                r'(?:California|New York|Texas|Florida|Massachusetts|Washington|Illinois),?\s*USA?'
-            ]
-            
-            for pattern in location_patterns:
-                try:
-                    matches = re.finditer(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        location = match.group().strip()
-                        if len(location) > 3 and location not in key_info['locations']:
-                            key_info['locations'].append(location)
-                except Exception as e:
-                    print(f"            ⚠️ Error in location pattern matching: {e}")
-                    continue
+            for location in self._iter_key_matches(_LOCATION_PATTERNS, text, text_bytes):
+                location = location.strip()
+                if len(location) > 3 and location not in seen['locations']:
+                    seen['locations'].add(location)
+                    key_info['locations'].append(location)
             
             # Years and dates - improved
-            year_patterns = [
-                r'(?:founded|established|started|incorporated|year)[:\s]*(\d{4})',
-                r'(\d{4})(?:\s*-\s*(?:founded|established|started))',
-                r'(?:as of|dated?)[:\s]*(\d{1,2}[-/]\d{1,2}[-/]\d{4})',
-                r'(?:since|from)\s*(\d{4})'
-            ]
-            
-            for pattern in year_patterns:
-                try:
-                    matches = re.finditer(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        date_info = match.group().strip()
-                        if date_info not in key_info['dates_and_years']:
-                            key_info['dates_and_years'].append(date_info)
-                except Exception as e:
-                    print(f"            ⚠️ Error in date pattern matching: {e}")
-                    continue
+            for date_info in self._iter_key_matches(_YEAR_PATTERNS, text, text_bytes):
+                date_info = date_info.strip()
+                if date_info not in seen['dates_and_years']:
+                    seen['dates_and_years'].add(date_info)
+                    key_info['dates_and_years'].append(date_info)
             
             # Industries and verticals - improved
-            industry_patterns = [
-                r'(?:industry|sector|market|vertical)[:\s]*([A-Z][a-zA-Z\s&,]+)',
-                r'(?:AI|Artificial Intelligence|Machine Learning|Software|Technology|Healthcare|Fintech|Biotech|SaaS)',
-                r'(?:Media and Information Services|Business Software|Enterprise|B2B|B2C)',
-                r'(?:EdTech|PropTech|HealthTech|CleanTech|FoodTech|RetailTech)'
-            ]
-            
-            for pattern in industry_patterns:
-                try:
-                    matches = re.finditer(pattern, text, re.IGNORECASE)
-                    for match in matches:
-                        industry = match.group().strip()
-                        if len(industry) > 2 and industry not in key_info['industries_and_verticals']:
-                            key_info['industries_and_verticals'].append(industry)
-                except Exception as e:
-                    print(f"            ⚠️ Error in industry pattern matching: {e}")
-                    continue
+            for industry in self._iter_key_matches(_INDUSTRY_PATTERNS, text, text_bytes):
+                industry = industry.strip()
+                if len(industry) > 2 and industry not in seen['industries_and_verticals']:
+                    seen['industries_and_verticals'].add(industry)
+                    key_info['industries_and_verticals'].append(industry)
             
         except Exception as e:
             print(f"            ⚠️ Error in key information extraction: {e}")
         
         return key_info
     
-    def extract_pptx_text(self, pptx_path: str, source_file_type: str = "unknown") -> Dict[str, Any]:
+    def _iter_key_matches(self, patterns: List[re.Pattern], text: str, text_bytes: Optional[bytes], group: int = 0) -> Iterator[str]:
+        """Yield one group of every match of each pattern, using the RE2 twins on text_bytes when given"""
+        if text_bytes is not None:
+            for pattern in patterns:
+                for match in _RE2_KEY_PATTERNS[pattern].finditer(text_bytes):
+                    yield match.group(group).decode()
+        else:
+            for pattern in patterns:
+                for match in pattern.finditer(text):
+                    yield match.group(group)
+    
+    def extract_pptx_text(self, pptx_path: str, source_file_type: str = "unknown", file_bytes: Optional[bytes] = None) -> Dict[str, Any]:
         """Enhanced PPTX text extraction with source file tracking and better error handling"""
         try:
-            # Open presentation with error handling
+            # python-pptx is imported on first use, so PDF-only runs never load it
+            from pptx import Presentation
+            
+            # Open presentation with error handling (from prefetched bytes when available)
             try:
-                prs = Presentation(pptx_path)
+                prs = Presentation(io.BytesIO(file_bytes) if file_bytes is not None else pptx_path)
             except Exception as e:
                 print(f"         ❌ Cannot open PPTX: {e}")
                 return self._create_error_result(pptx_path, source_file_type, f"Cannot open PPTX: {e}")
             
-            full_text = ""
-            images_text = ""
+            full_parts = []  # Slide text and image notes, joined once after the loop
+            images_parts = []
             slide_count = len(prs.slides)
             structured_content = []
+            full_length = 0  # length of the text collected so far, for the slide offsets
             
             if slide_count == 0:
                 print(f"         ❌ PPTX has no slides")
@@ -403,44 +873,50 @@ class DocumentExtractor:
                 try:
                     # ENHANCED: Add source file info to slide separator
                     slide_header = f"\n{'='*40}\nSOURCE_FILE: {source_file_type.upper()}\nSLIDE {slide_num + 1}\n{'='*40}\n"
-                    slide_text = ""
+                    slide_parts = []
                     
                     # Extract text from shapes with better error handling
                     shape_count = 0
                     for shape in slide.shapes:
                         try:
                             if hasattr(shape, "text") and shape.text.strip():
-                                slide_text += shape.text + "\n"
+                                slide_parts.append(shape.text + "\n")
                                 shape_count += 1
                             
                             # Handle images (basic detection)
                             if hasattr(shape, 'shape_type') and shape.shape_type == 13:  # Picture
                                 try:
                                     # ENHANCED: Include source file in image detection
-                                    images_text += f"[IMAGE DETECTED in {source_file_type.upper()}: Slide {slide_num + 1}]\n"
-                                    print(f"            🖼️  Image detected in slide {slide_num + 1}")
+                                    images_parts.append(f"[IMAGE DETECTED in {source_file_type.upper()}: Slide {slide_num + 1}]\n")
+                                    logger.debug("            🖼️  Image detected in slide %d", slide_num + 1)
                                 except Exception as e:
-                                    print(f"            ⚠️ Error processing image in slide {slide_num + 1}: {e}")
+                                    logger.warning("            ⚠️ Error processing image in slide %d: %s", slide_num + 1, e)
                         except Exception as shape_error:
-                            print(f"            ⚠️ Error processing shape in slide {slide_num + 1}: {shape_error}")
+                            logger.warning("            ⚠️ Error processing shape in slide %d: %s", slide_num + 1, shape_error)
                             continue
                     
+                    slide_text = "".join(slide_parts)
                     if slide_text.strip():
-                        full_text += slide_header + slide_text
+                        full_parts.append(slide_header + slide_text)
                         structured_content.append({
                             'source_file': source_file_type,
                             'slide': slide_num + 1,
-                            'content': slide_text,
+                            'start': full_length + len(slide_header),
+                            'end': full_length + len(slide_header) + len(slide_text),
                             'length': len(slide_text)
                         })
+                        full_length += len(slide_header) + len(slide_text)
                         
                         if shape_count > 0:
-                            print(f"            📝 Extracted text from {shape_count} shapes")
+                            logger.debug("            📝 Extracted text from %d shapes", shape_count)
                             
                 except Exception as slide_error:
-                    print(f"         ⚠️ Error processing slide {slide_num + 1}: {slide_error}")
+                    logger.warning("         ⚠️ Error processing slide %d: %s", slide_num + 1, slide_error)
                     continue
             
+            full_text = "".join(full_parts)
+            images_text = "".join(images_parts)
+            
             # Validate extracted content
             if not full_text.strip():
                 print(f"         ⚠️ No text content extracted from PPTX")
@@ -502,11 +978,17 @@ class DocumentExtractor:
             # ENHANCED: Create comprehensive section patterns with multiple alternatives
             section_patterns = self._create_comprehensive_section_patterns()
             
+            # Split once; detection and extraction walk the same lines. The text is lowercased once as a whole,
+            # and detection and the fuzzy fallback both match against the lowercase copy
+            lines = processed_text.split('\n')
+            processed_lower = processed_text.lower()
+            lines_lower = processed_lower.split('\n')
+            
             # IMPROVED: Advanced section detection with cross-page support
-            detected_sections = self._detect_sections_advanced(processed_text, section_patterns)
+            detected_sections = self._detect_sections_advanced(processed_text, section_patterns, lines, lines_lower)
             
             # ENHANCED: Extract content with better cross-page handling
-            extracted_sections = self._extract_section_content_advanced(processed_text, detected_sections)
+            extracted_sections = self._extract_section_content_advanced(processed_text, detected_sections, lines)
             
             # Merge with default sections
             for section_key, content in extracted_sections.items():
@@ -515,19 +997,22 @@ class DocumentExtractor:
             
             # IMPROVED: Validation and reporting
             sections_found = len([s for s in sections.values() if s.strip()])
-            print(f"            ✅ IMPROVED: Successfully extracted {sections_found}/{len(sections)} sections")
+            report = [f"            ✅ IMPROVED: Successfully extracted {sections_found}/{len(sections)} sections"]
             
-            # ENHANCED: Detailed logging of found sections
+            # ENHANCED: Detailed logging of found sections (the report is written in one call)
             for section_name, content in sections.items():
                 if content.strip():
-                    print(f"               • {section_name}: {len(content)} characters")
+                    report.append(f"               • {section_name}: {len(content)} characters")
             
             # IMPROVED: Debug missing sections
             missing_sections = [name for name, content in sections.items() if not content.strip()]
             if missing_sections:
-                print(f"            ⚠️ Missing sections: {', '.join(missing_sections)}")
+                report.append(f"            ⚠️ Missing sections: {', '.join(missing_sections)}")
+            sys.stdout.write('\n'.join(report) + '\n')
+            
+            if missing_sections:
                 # Try alternative extraction for missing sections
-                self._try_alternative_extraction(processed_text, sections, missing_sections)
+                self._try_alternative_extraction(processed_text, sections, missing_sections, processed_lower)
                 
         except Exception as e:
             print(f"            ❌ Error in IMPROVED memo section extraction: {e}")
@@ -539,46 +1024,29 @@ class DocumentExtractor:
     def _preprocess_memo_text(self, memo_text: str) -> str:
         """IMPROVED: Preprocess memo text to handle page breaks and formatting issues"""
         
-        # ENHANCED: Better handling of page breaks and formatting
-        lines = memo_text.split('\n')
+        # ENHANCED: Better handling of page breaks and formatting (all lines stripped in one pass)
+        lines = [line.strip() for line in memo_text.split('\n')]
         processed_lines = []
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            if not line:
-                processed_lines.append('')
-                i += 1
+        # Pair every line with the next one; a header joined with its continuation skips that line
+        skip_line = False
+        for line, next_line in zip(lines, lines[1:] + ['']):
+            if skip_line:
+                skip_line = False
                 continue
             
             # IMPROVED: Handle section headers that might be split across lines
-            if self._is_potential_section_header(line):
-                # Check if this might be a section header
-                potential_header = line
-                
-                # Look ahead for continuation
-                j = i + 1
-                while j < len(lines) and j < i + 3:  # Look ahead max 3 lines
-                    next_line = lines[j].strip()
-                    if not next_line:
-                        break
-                    if self._is_header_continuation(line, next_line):
-                        potential_header += " " + next_line
-                        i = j  # Skip the continuation line
-                    break
-                
-                processed_lines.append(potential_header)
-            else:
-                processed_lines.append(line)
+            if line and next_line and self._is_potential_section_header(line) and self._is_header_continuation(line, next_line):
+                line = f"{line} {next_line}"
+                skip_line = True
             
-            i += 1
+            processed_lines.append(line)
         
         # IMPROVED: Join with better spacing preservation
         processed_text = '\n'.join(processed_lines)
         
         # ENHANCED: Clean up excessive whitespace but preserve structure
-        processed_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', processed_text)
+        processed_text = _EXCESS_BLANK_LINES_PAT.sub('\n\n', processed_text)
         
         return processed_text
     
@@ -588,15 +1056,10 @@ class DocumentExtractor:
             return False
         
         # Common section header patterns
-        header_indicators = [
-            'executive', 'summary', 'company', 'information', 'startup', 'stage',
-            'deal', 'management', 'team', 'metrics', 'customer', 'problem',
-            'product', 'service', 'investment', 'themes', 'market', 'overview',
-            'competitors', 'competitive', 'advantage', 'considerations', 'risk', 'factors'
-        ]
-        
         line_lower = line.lower()
-        return any(indicator in line_lower for indicator in header_indicators)
+        if _SECTION_HEADER_AUTOMATON is not None:
+            return next(_SECTION_HEADER_AUTOMATON.iter(line_lower), None) is not None
+        return any(indicator in line_lower for indicator in _SECTION_HEADER_INDICATORS)
     
     def _is_header_continuation(self, first_line: str, second_line: str) -> bool:
         """Check if second line continues the first line header"""
@@ -605,25 +1068,9 @@ class DocumentExtractor:
             return False
         
         combined = f"{first_line} {second_line}".lower()
-        known_headers = [
-            'executive summary',
-            'company information', 
-            'startup stage',
-            'deal summary',
-            'management team',
-            'key metrics',
-            'customer problem',
-            'product and service summary',
-            'product service summary',
-            'investment themes',
-            'market overview',
-            'list of competitors',
-            'competitive advantage summary',
-            'investment considerations risk factors',
-            'investment considerations & risk factors'
-        ]
-        
-        return any(header in combined for header in known_headers)
+        if _KNOWN_HEADER_AUTOMATON is not None:
+            return next(_KNOWN_HEADER_AUTOMATON.iter(combined), None) is not None
+        return any(header in combined for header in _KNOWN_SECTION_HEADERS)
     
     def _create_comprehensive_section_patterns(self) -> Dict[str, List[str]]:
         """IMPROVED: Create comprehensive patterns for all section types"""
@@ -713,138 +1160,153 @@ class DocumentExtractor:
             ]
         }
     
-    def _detect_sections_advanced(self, text: str, section_patterns: Dict[str, List[str]]) -> Dict[str, Dict]:
-        """IMPROVED: Advanced section detection with position tracking"""
+    def _detect_sections_advanced(self, text: str, section_patterns: Dict[str, List[str]],
+                                  lines: Optional[List[str]] = None, lines_lower: Optional[List[str]] = None) -> Dict[str, SectionHit]:
+        """IMPROVED: Advanced section detection with position tracking (lines/lines_lower: text already split on newlines, as is and lowercased)"""
         
         detected = {}
-        lines = text.split('\n')
+        if lines is None:
+            lines = text.split('\n')
+        if lines_lower is None:
+            lines_lower = [line.lower() for line in lines]
+        
+        # Compiled patterns with their source length (the confidence of a pattern match), resolved once per scan,
+        # plus one alternation of all of a section's patterns: a line is only tried pattern by pattern when it matches
+        compiled_patterns = {}
+        for section_name, patterns in section_patterns.items():
+            section_compiled = []
+            for pattern in patterns:
+                try:
+                    section_compiled.append((_compile_section_pattern(pattern), len(pattern)))
+                except Exception as e:
+                    logger.warning("               ⚠️ Pattern error for %s: %s", pattern, e)
+            
+            section_union = None
+            if section_compiled:
+                section_union = _compile_section_pattern("|".join(f"(?:{pattern.pattern})" for pattern, _ in section_compiled))
+            compiled_patterns[section_name] = (section_union, section_compiled)
+        
+        # One alternation over every section's patterns: lines it does not match skip all per-section pattern searches
+        section_unions = [section_union.pattern for section_union, _ in compiled_patterns.values() if section_union is not None]
+        all_sections_union = _compile_section_pattern("|".join(f"(?:{union})" for union in section_unions)) if section_unions else None
+        
+        # The anchor words only cover the built-in patterns
+        use_anchors = section_patterns == self._create_comprehensive_section_patterns()
         
         print(f"            🔍 Scanning {len(lines)} lines for section headers...")
         
-        for line_num, line in enumerate(lines):
+        # Per-match diagnostics are debug-level; checked once so disabled logging costs nothing in the loop
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        
+        # All per-line work (strip, lowercase, clean, exact lookup, pattern pre-screen) happens once per line,
+        # before any section is looked at
+        for line_num, (line, line_lower) in enumerate(zip(lines, lines_lower)):
             original_line = line.strip()
-            line_lower = original_line.lower()
+            if len(original_line) < 3:
+                continue
+            
+            line_lower = line_lower.strip()
+            
+            # Clean line for matching (ASCII lines with a C-level byte delete instead of a regex substitution)
+            line_is_ascii = line_lower.isascii()
+            if line_is_ascii:
+                clean_line = line_lower.encode('ascii').translate(None, _NON_HEADER_ASCII_BYTES).decode('ascii').strip()
+            else:
+                clean_line = _NON_HEADER_CHARS_PAT.sub('', line_lower).strip()
             
-            if not original_line or len(original_line) < 3:
+            # ENHANCED: Exact match priority (one lookup per line); lines with no exact or pattern match are done
+            exact_section = _EXACT_SECTION_HEADERS.get(clean_line)
+            if use_anchors and line_is_ascii and not _SECTION_ANCHOR_PAT.search(line_lower):
+                any_pattern_matches = False
+            else:
+                any_pattern_matches = all_sections_union is not None and all_sections_union.search(line_lower) is not None
+            if any_pattern_matches:
+                sections_to_check = compiled_patterns.items()
+            elif exact_section in compiled_patterns:
+                # Only the exactly named section can match a line that no pattern matches
+                sections_to_check = [(exact_section, compiled_patterns[exact_section])]
+            else:
                 continue
             
             # IMPROVED: Try exact matches first, then pattern matches
-            for section_name, patterns in section_patterns.items():
+            for section_name, (section_union, patterns) in sections_to_check:
                 matched = False
                 match_type = "none"
                 confidence = 0
                 
-                # Clean line for matching
-                clean_line = re.sub(r'[^\w\s&]', '', line_lower).strip()
-                
-                # ENHANCED: Exact match priority
-                exact_matches = {
-                    "executive summary": "executive_summary",
-                    "company information": "company_information", 
-                    "startup stage": "startup_stage",
-                    "deal summary": "deal_summary",
-                    "management team": "management_team",
-                    "key metrics": "key_metrics",
-                    "customer problem": "customer_problem",
-                    "product and service summary": "product_service_summary",
-                    "product service summary": "product_service_summary",
-                    "investment themes": "investment_themes",
-                    "market overview": "market_overview",
-                    "list of competitors": "list_of_competitors",
-                    "competitive advantage summary": "competitive_advantage_summary",
-                    "investment considerations & risk factors": "investment_considerations_risk_factors",
-                    "investment considerations risk factors": "investment_considerations_risk_factors"
-                }
-                
-                if clean_line in exact_matches and exact_matches[clean_line] == section_name:
+                if exact_section == section_name:
                     matched = True
                     match_type = "exact"
                     confidence = 100
                 
-                # IMPROVED: Pattern matching with confidence scoring
-                if not matched:
-                    for pattern in patterns:
-                        try:
-                            if re.search(pattern, line_lower, re.IGNORECASE):
-                                matched = True
-                                match_type = "pattern"
-                                confidence = 80 + len(pattern)  # Longer patterns get higher confidence
-                                break
-                        except Exception as e:
-                            print(f"               ⚠️ Pattern error for {pattern}: {e}")
-                            continue
+                # IMPROVED: Pattern matching with confidence scoring (the first pattern in order that matches sets it)
+                if not matched and any_pattern_matches and section_union is not None and section_union.search(line_lower):
+                    for pattern, pattern_length in patterns:
+                        if pattern.search(line_lower):
+                            matched = True
+                            match_type = "pattern"
+                            confidence = 80 + pattern_length  # Longer patterns get higher confidence
+                            break
                 
                 if matched:
                     # IMPROVED: Store detection with metadata
-                    if section_name not in detected or detected[section_name]['confidence'] < confidence:
-                        detected[section_name] = {
-                            'line_num': line_num,
-                            'line_text': original_line,
-                            'match_type': match_type,
-                            'confidence': confidence,
-                            'clean_text': clean_line
-                        }
-                        print(f"               ✓ FOUND: '{section_name}' at line {line_num + 1} ({match_type}, confidence: {confidence})")
+                    if section_name not in detected or detected[section_name].confidence < confidence:
+                        detected[section_name] = SectionHit(line_num, original_line, match_type, confidence, clean_line)
+                        if debug_enabled:
+                            logger.debug("               ✓ FOUND: '%s' at line %d (%s, confidence: %d)",
+                                         section_name, line_num + 1, match_type, confidence)
         
         print(f"            📊 Detected {len(detected)} sections with advanced method")
         return detected
     
-    def _extract_section_content_advanced(self, text: str, detected_sections: Dict[str, Dict]) -> Dict[str, str]:
-        """IMPROVED: Advanced content extraction with cross-page support"""
+    def _extract_section_content_advanced(self, text: str, detected_sections: Dict[str, SectionHit],
+                                          lines: Optional[List[str]] = None) -> Dict[str, str]:
+        """IMPROVED: Advanced content extraction with cross-page support (lines: text already split on newlines)"""
         
         extracted = {}
-        lines = text.split('\n')
+        if lines is None:
+            lines = text.split('\n')
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         # IMPROVED: Sort sections by line number for proper processing
-        sorted_sections = sorted(detected_sections.items(), key=lambda x: x[1]['line_num'])
+        sorted_sections = sorted(detected_sections.items(), key=lambda x: x[1].line_num)
         
         for i, (section_name, section_info) in enumerate(sorted_sections):
-            start_line = section_info['line_num']
+            start_line = section_info.line_num
             
             # IMPROVED: Determine end line (next section or end of document)
             if i + 1 < len(sorted_sections):
-                end_line = sorted_sections[i + 1][1]['line_num']
+                end_line = sorted_sections[i + 1][1].line_num
             else:
                 end_line = len(lines)
             
-            # ENHANCED: Extract content with better handling
-            content_lines = []
+            # ENHANCED: Extract content with better handling (the lines after the section header, sliced in one go)
+            segment = lines[start_line + 1:end_line]
             
-            # Start from the line after the section header
-            for line_idx in range(start_line + 1, end_line):
-                if line_idx >= len(lines):
-                    break
-                
-                line = lines[line_idx].strip()
-                
-                # IMPROVED: Skip empty lines at the beginning but preserve structure within content
-                if not content_lines and not line:
-                    continue
-                
-                # ENHANCED: Stop if we hit another section header (safety check)
-                if line and self._is_potential_section_header(line) and line_idx != start_line + 1:
+            # ENHANCED: Stop if we hit another section header (safety check); only a segment containing a definite
+            # section start can trip it, so most sections skip the per-line check entirely
+            if _DEFINITE_SECTION_PAT.search('\n'.join(segment).lower()):
+                for offset, raw_line in enumerate(segment[1:], 1):
+                    line = raw_line.strip()
                     # Double-check this isn't part of the content
-                    if self._is_definitely_new_section(line, section_name):
+                    if line and self._is_potential_section_header(line) and self._is_definitely_new_section(line, section_name):
+                        segment = segment[:offset]
                         break
-                
-                content_lines.append(line)
+            
+            # IMPROVED: Drop empty lines at the beginning and end but preserve structure within content
+            content = '\n'.join(line.strip() for line in segment).strip()
             
             # IMPROVED: Post-process content
-            if content_lines:
-                # Remove trailing empty lines
-                while content_lines and not content_lines[-1]:
-                    content_lines.pop()
-                
-                content = '\n'.join(content_lines).strip()
-                
+            if content:
                 # ENHANCED: Quality check - ensure we have substantial content
                 if len(content) >= 5:  # Very minimal requirement
                     extracted[section_name] = content
-                    print(f"               ✅ Extracted '{section_name}': {len(content)} chars")
-                else:
-                    print(f"               ⚠️ '{section_name}' too short: {len(content)} chars")
-            else:
-                print(f"               ⚠️ No content found for '{section_name}'")
+                    if debug_enabled:
+                        logger.debug("               ✅ Extracted '%s': %d chars", section_name, len(content))
+                elif debug_enabled:
+                    logger.debug("               ⚠️ '%s' too short: %d chars", section_name, len(content))
+            elif debug_enabled:
+                logger.debug("               ⚠️ No content found for '%s'", section_name)
         
         return extracted
     
@@ -854,89 +1316,140 @@ class DocumentExtractor:
         line_lower = line.lower()
         
         # Known section starters that are definitely new sections
-        definite_sections = [
-            'executive summary', 'company information', 'startup stage',
-            'deal summary', 'management team', 'key metrics',
-            'customer problem', 'product and service summary',
-            'investment themes', 'market overview', 'list of competitors',
-            'competitive advantage summary', 'investment considerations'
-        ]
-        
-        return any(section in line_lower for section in definite_sections)
+        return _DEFINITE_SECTION_PAT.search(line_lower) is not None
     
-    def _try_alternative_extraction(self, text: str, sections: Dict[str, str], missing_sections: List[str]):
+    def _try_alternative_extraction(self, text: str, sections: Dict[str, str], missing_sections: List[str],
+                                    text_lower: Optional[str] = None):
         """IMPROVED: Try alternative extraction methods for missing sections"""
         
         print(f"            🔄 Trying alternative extraction for {len(missing_sections)} missing sections...")
         
-        # Try fuzzy matching and keyword-based extraction
+        # Try fuzzy matching and keyword-based extraction (each paragraph is scanned once for every section's keywords)
+        paragraph_keywords = self._find_paragraph_keywords(text, text_lower)
         for section_name in missing_sections:
-            content = self._fuzzy_section_extraction(text, section_name)
+            content = self._best_keyword_paragraph(paragraph_keywords, section_name)
             if content and len(content.strip()) >= 10:
                 sections[section_name] = content
-                print(f"               ✅ Alternative extraction successful for '{section_name}': {len(content)} chars")
+                logger.debug("               ✅ Alternative extraction successful for '%s': %d chars", section_name, len(content))
     
-    def _fuzzy_section_extraction(self, text: str, section_name: str) -> str:
-        """IMPROVED: Fuzzy extraction based on keywords and context"""
-        
-        # Define keywords for each section type
-        keywords_map = {
-            "executive_summary": ["executive", "summary", "overview", "brief"],
-            "company_information": ["company", "business", "organization", "firm"],
-            "startup_stage": ["stage", "funding", "round", "series"],
-            "deal_summary": ["deal", "transaction", "investment", "funding"],
-            "management_team": ["team", "management", "leadership", "founders", "ceo", "cto"],
-            "key_metrics": ["metrics", "kpi", "performance", "financial", "revenue"],
-            "customer_problem": ["problem", "challenge", "pain", "issue", "customer"],
-            "product_service_summary": ["product", "service", "solution", "offering"],
-            "investment_themes": ["investment", "themes", "thesis", "rationale"],
-            "market_overview": ["market", "industry", "sector", "opportunity"],
-            "list_of_competitors": ["competitors", "competition", "competitive"],
-            "competitive_advantage_summary": ["advantage", "differentiation", "unique"],
-            "investment_considerations_risk_factors": ["risk", "considerations", "factors", "challenges"]
-        }
+    def _find_paragraph_keywords(self, text: str, text_lower: Optional[str] = None) -> List[Tuple[str, Set[str]]]:
+        """Paragraphs long enough to score (stripped), each with the fuzzy keywords it contains (text_lower: text.lower())"""
+        paragraph_keywords = []
+        if text_lower is None:
+            text_lower = text.lower()
         
-        if section_name not in keywords_map:
+        for paragraph, paragraph_lower in zip(text.split('\n\n'), text_lower.split('\n\n')):
+            stripped_paragraph = paragraph.strip()
+            if len(stripped_paragraph) < 20:
+                continue
+            
+            # One automaton pass finds every keyword of every section
+            if _FUZZY_KEYWORD_AUTOMATON is not None:
+                found_keywords = {keyword for _, keyword in _FUZZY_KEYWORD_AUTOMATON.iter(paragraph_lower)}
+            else:
+                found_keywords = {keyword for keyword in _FUZZY_KEYWORDS if keyword in paragraph_lower}
+            
+            paragraph_keywords.append((stripped_paragraph, found_keywords))
+        
+        return paragraph_keywords
+    
+    def _best_keyword_paragraph(self, paragraph_keywords: List[Tuple[str, Set[str]]], section_name: str) -> str:
+        """Pick the first paragraph with the most of a section's keywords (at least 2)"""
+        if section_name not in _FUZZY_SECTION_KEYWORDS:
             return ""
         
-        keywords = keywords_map[section_name]
+        keywords = _FUZZY_SECTION_KEYWORDS[section_name]
         
         # Find paragraphs that contain multiple keywords from this section
-        paragraphs = text.split('\n\n')
         best_paragraph = ""
         best_score = 0
         
-        for paragraph in paragraphs:
-            if len(paragraph.strip()) < 20:
-                continue
-            
-            score = 0
-            paragraph_lower = paragraph.lower()
-            
-            for keyword in keywords:
-                if keyword in paragraph_lower:
-                    score += 1
+        for paragraph, found_keywords in paragraph_keywords:
+            score = len(keywords & found_keywords)
             
             if score > best_score and score >= 2:  # Need at least 2 keyword matches
                 best_score = score
-                best_paragraph = paragraph.strip()
+                best_paragraph = paragraph
         
         return best_paragraph
     
-    def process_source_files(self, source_files: Dict[str, str]) -> Dict[str, Any]:
+    def read_source_files(self, file_paths: List[str]) -> Dict[str, bytes]:
+        """Read source files concurrently in one batch; unreadable files are left to process_source_files to report"""
+        def _read(path: str) -> Optional[bytes]:
+            try:
+                if os.path.getsize(path) > MAX_SOURCE_FILE_BYTES:
+                    return None
+                with open(path, 'rb') as f:
+                    return f.read()
+            except OSError:
+                return None
+        
+        unique_paths = list(dict.fromkeys(file_paths))
+        if not unique_paths:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(unique_paths))) as pool:
+            contents = pool.map(_read, unique_paths)
+            return {path: data for path, data in zip(unique_paths, contents) if data is not None}
+    
+    def _extract_source_files_parallel(self, source_files: Dict[str, str], file_sizes: Dict[str, Optional[int]],
+                                       file_cache: Optional[Dict[str, bytes]] = None) -> Dict[str, Tuple[Dict[str, Any], str]]:
+        """Extract the valid source files on a process pool; returns {file_type: (doc_data, printed output)}, empty when sequential"""
+        jobs = [(file_type, file_path) for file_type, file_path in source_files.items()
+                if file_sizes[file_type] and file_sizes[file_type] <= MAX_SOURCE_FILE_BYTES
+                and file_path.lower().endswith(('.pdf', '.pptx', '.ppt'))]
+        max_workers = min(MAX_SOURCE_FILE_WORKERS, len(jobs), os.cpu_count() or 1)
+        if max_workers < 2:
+            return {}
+        
+        results = {}
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_pdf_worker,
+                                     initargs=(self.cache_dir,)) as pool:
+                futures = {file_type: pool.submit(_extract_source_file, file_path, file_type,
+                                                  file_cache.get(file_path) if file_cache else None)
+                           for file_type, file_path in jobs}
+                for file_type, future in futures.items():
+                    try:
+                        results[file_type] = future.result()
+                    except Exception as e:
+                        # Left out of the results, so the file is extracted in this process instead
+                        logger.warning("         ⚠️ Parallel extraction failed for %s, extracting sequentially: %s", file_type, e)
+        except Exception as e:
+            print(f"         ⚠️ Parallel file extraction failed, extracting sequentially: {e}")
+        return results
+    
+    def process_source_files(self, source_files: Dict[str, str], file_cache: Optional[Dict[str, bytes]] = None) -> Dict[str, Any]:
         """Enhanced source file processing with better error handling and validation"""
         all_documents = {}
-        combined_source_text = ""
+        combined_buffer = io.StringIO()  # Combined source text, written once per document instead of re-copied
         total_files_processed = 0
         total_content_length = 0
         processing_errors = []
         
         print(f"    📁 Processing {len(source_files)} source files (Ground Truth):")
         
+        # One stat call per file both checks that it exists and gives its size (None: not found)
+        file_sizes = {}
+        for file_type, file_path in source_files.items():
+            file_bytes = file_cache.get(file_path) if file_cache else None
+            if file_bytes is not None:
+                file_sizes[file_type] = len(file_bytes)
+            else:
+                try:
+                    file_sizes[file_type] = os.stat(file_path).st_size
+                except (OSError, ValueError):
+                    file_sizes[file_type] = None
+        
+        # Files that pass the checks below are extracted in parallel worker processes when there are two or more
+        parallel_results = self._extract_source_files_parallel(source_files, file_sizes, file_cache)
+        
         for file_type, file_path in source_files.items():
             print(f"      📄 {file_type}: {os.path.basename(file_path)}")
+            file_bytes = file_cache.get(file_path) if file_cache else None
             
-            if not os.path.exists(file_path):
+            file_size = file_sizes[file_type]
+            if file_size is None:
                 error_msg = f"File not found: {file_path}"
                 print(f"         ❌ {error_msg}")
                 processing_errors.append(f"{file_type}: {error_msg}")
@@ -944,7 +1457,6 @@ class DocumentExtractor:
             
             # Check file size and accessibility
             try:
-                file_size = os.path.getsize(file_path)
                 if file_size == 0:
                     error_msg = f"File is empty: {file_path}"
                     print(f"         ❌ {error_msg}")
@@ -952,7 +1464,7 @@ class DocumentExtractor:
                     continue
                 
                 # Check if file is too large (>100MB)
-                if file_size > 100 * 1024 * 1024:
+                if file_size > MAX_SOURCE_FILE_BYTES:
                     error_msg = f"File too large ({file_size / (1024*1024):.1f} MB): {file_path}"
                     print(f"         ⚠️ {error_msg}")
                     processing_errors.append(f"{file_type}: {error_msg}")
@@ -969,10 +1481,14 @@ class DocumentExtractor:
             # Process based on file type - ENHANCED: Pass source file type
             doc_data = None
             try:
-                if file_path.lower().endswith('.pdf'):
-                    doc_data = self.extract_pdf_text(file_path, file_type)
+                if file_type in parallel_results:
+                    # Extracted by a worker process; replay its progress output in file order
+                    doc_data, extraction_output = parallel_results[file_type]
+                    sys.stdout.write(extraction_output)
+                elif file_path.lower().endswith('.pdf'):
+                    doc_data = self.extract_pdf_text(file_path, file_type, file_bytes)
                 elif file_path.lower().endswith(('.pptx', '.ppt')):
-                    doc_data = self.extract_pptx_text(file_path, file_type)
+                    doc_data = self.extract_pptx_text(file_path, file_type, file_bytes)
                 else:
                     error_msg = f"Unsupported file type: {os.path.splitext(file_path)[1]}"
                     print(f"         ❌ {error_msg}")
@@ -992,44 +1508,48 @@ class DocumentExtractor:
                 total_content_length += len(doc_data['combined_text'])
                 
                 # Combine all source text with enhanced separators
-                combined_source_text += f"\n\n{'='*80}\n"
-                combined_source_text += f"SOURCE DOCUMENT: {file_type.upper().replace('_', ' ')}\n"
-                combined_source_text += f"FILE: {os.path.basename(file_path)}\n"
-                combined_source_text += f"TYPE: {doc_data.get('pages', doc_data.get('slides', 'unknown'))} {'pages' if 'pages' in doc_data else 'slides'}\n"
-                combined_source_text += f"LENGTH: {len(doc_data['combined_text']):,} characters\n"
-                combined_source_text += f"EXTRACTION_STATUS: SUCCESS\n"
-                combined_source_text += f"{'='*80}\n\n"
-                combined_source_text += doc_data['combined_text']
-                
-                print(f"         ✅ Successfully processed - {len(doc_data['combined_text']):,} characters")
+                combined_buffer.write(f"\n\n{'='*80}\n")
+                combined_buffer.write(f"SOURCE DOCUMENT: {file_type.upper().replace('_', ' ')}\n")
+                combined_buffer.write(f"FILE: {os.path.basename(file_path)}\n")
+                combined_buffer.write(f"TYPE: {doc_data.get('pages', doc_data.get('slides', 'unknown'))} {'pages' if 'pages' in doc_data else 'slides'}\n")
+                combined_buffer.write(f"LENGTH: {len(doc_data['combined_text']):,} characters\n")
+                combined_buffer.write(f"EXTRACTION_STATUS: SUCCESS\n")
+                combined_buffer.write(f"{'='*80}\n\n")
+                combined_buffer.write(doc_data['combined_text'])
                 
                 # Validate key information extraction
                 key_info = self.extract_key_information(doc_data['combined_text'])
                 total_keys = sum(len(v) for v in key_info.values())
-                print(f"         🔍 Extracted {total_keys} key information items")
+                sys.stdout.write(f"         ✅ Successfully processed - {len(doc_data['combined_text']):,} characters\n"
+                                 f"         🔍 Extracted {total_keys} key information items\n")
                 
             else:
                 error_msg = doc_data.get('error', 'No content extracted from file')
                 print(f"         ❌ {error_msg}")
                 processing_errors.append(f"{file_type}: {error_msg}")
         
-        # Enhanced summary with validation
-        print(f"    📊 Processing Summary:")
-        print(f"       ✅ Files processed: {total_files_processed}/{len(source_files)}")
-        print(f"       📄 Total content: {total_content_length:,} characters")
-        print(f"       🔍 Combined text length: {len(combined_source_text):,} characters")
+        combined_source_text = combined_buffer.getvalue()
+        
+        # Enhanced summary with validation (collected and written in one call)
+        summary = [
+            f"    📊 Processing Summary:",
+            f"       ✅ Files processed: {total_files_processed}/{len(source_files)}",
+            f"       📄 Total content: {total_content_length:,} characters",
+            f"       🔍 Combined text length: {len(combined_source_text):,} characters"
+        ]
         
         if processing_errors:
-            print(f"       ⚠️ Errors encountered: {len(processing_errors)}")
+            summary.append(f"       ⚠️ Errors encountered: {len(processing_errors)}")
             for error in processing_errors:
-                print(f"          - {error}")
+                summary.append(f"          - {error}")
         
         # Additional validation
         validation_passed = combined_source_text and len(combined_source_text) > 1000
         if validation_passed:
-            print(f"       ✅ Source text validation: PASSED")
+            summary.append(f"       ✅ Source text validation: PASSED")
         else:
-            print(f"       ⚠️ Source text validation: WARNING - Combined text may be insufficient")
+            summary.append(f"       ⚠️ Source text validation: WARNING - Combined text may be insufficient")
+        sys.stdout.write('\n'.join(summary) + '\n')
         
         return {
             "individual_documents": all_documents,
@@ -1045,7 +1565,10 @@ class DocumentExtractor:
         """Enhanced AI memo processing with better validation and error handling"""
         print(f"    🤖 Processing AI-generated memo: {os.path.basename(memo_path)}")
         
-        if not os.path.exists(memo_path):
+        # One stat call both checks that the memo exists and gives its size
+        try:
+            file_size = os.stat(memo_path).st_size
+        except (OSError, ValueError):
             error_msg = f"AI memo not found: {memo_path}"
             print(f"         ❌ {error_msg}")
             return {
@@ -1060,7 +1583,6 @@ class DocumentExtractor:
         
         # Check file size and accessibility
         try:
-            file_size = os.path.getsize(memo_path)
             if file_size == 0:
                 error_msg = "AI memo file is empty"
                 print(f"         ❌ {error_msg}")
@@ -1142,9 +1664,9 @@ class DocumentExtractor:
             # Count non-empty sections
             sections_found = len([s for s in memo_sections.values() if s.strip()])
             
-            print(f"         ✅ IMPROVED memo processing complete:")
-            print(f"            📄 Text extracted: {len(memo_text):,} characters")
-            print(f"            📋 Sections found: {sections_found}/{len(memo_sections)}")
+            sys.stdout.write(f"         ✅ IMPROVED memo processing complete:\n"
+                             f"            📄 Text extracted: {len(memo_text):,} characters\n"
+                             f"            📋 Sections found: {sections_found}/{len(memo_sections)}\n")
             
             return {
                 "memo_text": memo_text,
@@ -1254,17 +1776,20 @@ class DocumentExtractor:
                 "memo_errors": [result["ai_generated_memo"].get("error")] if result["ai_generated_memo"].get("error") else []
             }
             
-            print(f"  📊 Processing Summary for {company_name}:")
-            print(f"     📁 Source files: {source_files_count} processed")
-            print(f"     📄 Source content: {source_content_length:,} characters")
-            print(f"     🤖 AI memo sections: {memo_sections_count} found")
-            print(f"     📋 Total content: {source_content_length + memo_content_length:,} characters")
-            print(f"     ✅ Processing success: {processing_success}")
+            summary = [
+                f"  📊 Processing Summary for {company_name}:",
+                f"     📁 Source files: {source_files_count} processed",
+                f"     📄 Source content: {source_content_length:,} characters",
+                f"     🤖 AI memo sections: {memo_sections_count} found",
+                f"     📋 Total content: {source_content_length + memo_content_length:,} characters",
+                f"     ✅ Processing success: {processing_success}"
+            ]
             
             # Report any errors
             total_errors = len(result["processing_summary"]["source_errors"]) + len(result["processing_summary"]["memo_errors"])
             if total_errors > 0:
-                print(f"     ⚠️ Errors encountered: {total_errors}")
+                summary.append(f"     ⚠️ Errors encountered: {total_errors}")
+            sys.stdout.write('\n'.join(summary) + '\n')
                 
         except Exception as e:
             print(f"     ❌ Error generating processing summary: {e}")
@@ -1280,51 +1805,91 @@ class DocumentExtractor:
         try:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             
-            # Create data directory if it doesn't exist
-            os.makedirs("data/extracted", exist_ok=True)
+            # Create data directory if it doesn't exist (once per process and working directory)
+            extracted_dir = os.path.abspath("data/extracted")
+            if extracted_dir not in DocumentExtractor._ensured_dirs:
+                os.makedirs(extracted_dir, exist_ok=True)
+                DocumentExtractor._ensured_dirs.add(extracted_dir)
             
-            # Save source data summary
-            if data.get('source_of_truth'):
+            # Save source data summary (the combined text and source results are looked up once)
+            source_of_truth = data.get('source_of_truth')
+            if source_of_truth:
                 try:
                     source_file = f"data/extracted/{company_name}_source_truth_{timestamp}.json"
+                    combined_source_text = data.get('combined_source_text', '')
                     source_summary = {
                         'company_name': company_name,
                         'extraction_timestamp': timestamp,
-                        'files_processed': data['source_of_truth'].get('files_processed', 0),
-                        'total_length': len(data.get('combined_source_text', '')),
-                        'success_rate': data['source_of_truth'].get('success_rate', 0),
-                        'validation_passed': data['source_of_truth'].get('validation_passed', False),
-                        'processing_errors': data['source_of_truth'].get('processing_errors', []),
-                        'sample_content': data.get('combined_source_text', '')[:1000] + '...' if data.get('combined_source_text') else '',
-                        'key_information_sample': self.extract_key_information(data.get('combined_source_text', ''))
+                        'files_processed': source_of_truth.get('files_processed', 0),
+                        'total_length': len(combined_source_text),
+                        'success_rate': source_of_truth.get('success_rate', 0),
+                        'validation_passed': source_of_truth.get('validation_passed', False),
+                        'processing_errors': source_of_truth.get('processing_errors', []),
+                        'sample_content': combined_source_text[:1000] + '...' if combined_source_text else '',
+                        'key_information_sample': self.extract_key_information(combined_source_text)
                     }
                     
-                    with open(source_file, 'w', encoding='utf-8') as f:
-                        json.dump(source_summary, f, indent=2, ensure_ascii=False)
+                    # Serialized up front and published with one write and a rename (never a partial file)
+                    _write_file_atomic(source_file, _to_indented_json(source_summary))
                     print(f"     💾 Source data summary saved: {source_file}")
                 except Exception as e:
                     print(f"     ⚠️ Could not save source data: {e}")
             
             # Save AI memo data summary
-            if data.get('ai_generated_memo'):
+            ai_memo = data.get('ai_generated_memo')
+            if ai_memo:
                 try:
                     memo_file = f"data/extracted/{company_name}_ai_memo_{timestamp}.json"
                     memo_summary = {
                         'company_name': company_name,
                         'extraction_timestamp': timestamp,
-                        'sections_found': data['ai_generated_memo'].get('sections_found', 0),
-                        'total_length': data['ai_generated_memo'].get('total_length', 0),
-                        'extraction_success': data['ai_generated_memo'].get('extraction_success', False),
+                        'sections_found': ai_memo.get('sections_found', 0),
+                        'total_length': ai_memo.get('total_length', 0),
+                        'extraction_success': ai_memo.get('extraction_success', False),
                         'sections': {k: v[:300] + '...' if len(v) > 300 else v 
-                                   for k, v in data['ai_generated_memo'].get('memo_sections', {}).items() if v.strip()},
-                        'error': data['ai_generated_memo'].get('error')
+                                   for k, v in ai_memo.get('memo_sections', {}).items() if v and not v.isspace()},
+                        'error': ai_memo.get('error')
                     }
                     
-                    with open(memo_file, 'w', encoding='utf-8') as f:
-                        json.dump(memo_summary, f, indent=2, ensure_ascii=False)
+                    _write_file_atomic(memo_file, _to_indented_json(memo_summary))
                     print(f"     💾 AI memo summary saved: {memo_file}")
                 except Exception as e:
                     print(f"     ⚠️ Could not save memo data: {e}")
                     
         except Exception as e:
-            print(f"     ⚠️ Warning: Could not save extracted data: {e}")
\ No newline at end of file
+            print(f"     ⚠️ Warning: Could not save extracted data: {e}")
+
+
+# One extractor per worker process, so its Tesseract handle (model loaded once) and in-memory
+# OCR cache serve every block the worker is given
+_worker_extractor: Optional[DocumentExtractor] = None
+
+
+def _init_pdf_worker(cache_dir: Optional[str] = CACHE_DIR):
+    """Worker process initializer: create the extractor shared by this worker's page blocks"""
+    global _worker_extractor
+    _worker_extractor = DocumentExtractor(cache_dir=cache_dir)
+
+
+def _extract_source_file(file_path: str, source_file_type: str, file_bytes: Optional[bytes]) -> Tuple[Dict[str, Any], str]:
+    """Worker process entry point: extract one PDF or PPTX file, returning its result and the progress it printed"""
+    if _worker_extractor is None:
+        _init_pdf_worker()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        if file_path.lower().endswith('.pdf'):
+            doc_data = _worker_extractor.extract_pdf_text(file_path, source_file_type, file_bytes)
+        else:
+            doc_data = _worker_extractor.extract_pptx_text(file_path, source_file_type, file_bytes)
+    return doc_data, output.getvalue()
+
+
+def _extract_pdf_page_block(pdf_path: str, page_nums: range, source_file_type: str) -> List[Tuple[str, str, Optional[Dict[str, Any]]]]:
+    """Worker process entry point: extract a block of PDF pages from its own document handle"""
+    if _worker_extractor is None:
+        _init_pdf_worker()
+    doc = fitz.open(pdf_path)
+    try:
+        return _worker_extractor._extract_pdf_pages(doc, page_nums, source_file_type)
+    finally:
+        doc.close()
@@ -1,10 +1,27 @@
 import os
+import sys
+import mmap
 import zipfile
 import shutil
 from datetime import datetime
 import json
-from typing import List, Dict
-import glob
+from typing import List, Dict, Optional, Tuple
+
+# Optional: faster JSON encoding of the package metadata
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The small text entries (metadata, summary) are deflated at the fastest level
+TEXT_ENTRY_COMPRESSLEVEL = 1
+
+def _scan_dir(dir_path: str, prefix: str = '', suffix: str = '') -> List[os.DirEntry]:
+    """Files in dir_path named prefix*suffix (hidden files excluded, as with a glob); their stat() results are cached"""
+    with os.scandir(dir_path) as entries:
+        return [entry for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+                and not entry.name.startswith('.') and entry.is_file()]
 
 class ReportsDownloadManager:
     def __init__(self, reports_dir: str = "data/reports"):
@@ -17,28 +34,34 @@ class ReportsDownloadManager:
     
     def get_all_report_files(self) -> List[str]:
         """Get all report files from the reports directory"""
+        return [file_path for file_path, _ in self._get_report_entries()]
+    
+    def _get_report_entries(self) -> List[Tuple[str, os.stat_result]]:
+        """Report files with their stat results (newest first), each file stat'ed once"""
         if not os.path.exists(self.reports_dir):
             print(f"❌ Reports directory not found: {self.reports_dir}")
             return []
         
         # Find all PDF files in reports directory
-        pdf_files = glob.glob(os.path.join(self.reports_dir, "*.pdf"))
+        pdf_entries = [(entry.path, entry.stat()) for entry in _scan_dir(self.reports_dir, suffix='.pdf')]
         
-        if not pdf_files:
+        if not pdf_entries:
             print(f"⚠️ No PDF reports found in {self.reports_dir}")
             return []
         
         # Sort by modification time (newest first)
-        pdf_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        pdf_entries.sort(key=lambda entry: entry[1].st_mtime, reverse=True)
         
-        print(f"📄 Found {len(pdf_files)} report files:")
-        for i, file_path in enumerate(pdf_files, 1):
+        # The listing is collected and written in one call
+        listing = [f"📄 Found {len(pdf_entries)} report files:"]
+        for i, (file_path, file_stats) in enumerate(pdf_entries, 1):
             file_name = os.path.basename(file_path)
-            file_size = os.path.getsize(file_path) / (1024 * 1024)  # MB
-            mod_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-            print(f"   {i}. {file_name} ({file_size:.1f} MB) - {mod_time.strftime('%Y-%m-%d %H:%M')}")
+            file_size = file_stats.st_size / (1024 * 1024)  # MB
+            mod_time = datetime.fromtimestamp(file_stats.st_mtime)
+            listing.append(f"   {i}. {file_name} ({file_size:.1f} MB) - {mod_time.strftime('%Y-%m-%d %H:%M')}")
+        sys.stdout.write('\n'.join(listing) + '\n')
         
-        return pdf_files
+        return pdf_entries
     
     def create_reports_zip(self, include_metadata: bool = True) -> str:
         """Create a zip file with all reports"""
@@ -46,7 +69,8 @@ class ReportsDownloadManager:
         zip_filename = f"AI_Quality_Reports_{timestamp}.zip"
         zip_path = os.path.join(self.downloads_dir, zip_filename)
         
-        report_files = self.get_all_report_files()
+        report_entries = self._get_report_entries()
+        report_files = [file_path for file_path, _ in report_entries]
         
         if not report_files:
             print("❌ No reports to package")
@@ -54,42 +78,63 @@ class ReportsDownloadManager:
         
         print(f"\n📦 Creating download package: {zip_filename}")
         
+        # Progress lines are collected and written in one call once the package is done (or has failed)
+        report = []
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # PDFs are already compressed internally, so they are stored as-is; only the text entries are deflated
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zipf:
                 # Add all report files
                 for file_path in report_files:
                     file_name = os.path.basename(file_path)
-                    zipf.write(file_path, file_name)
-                    print(f"   ✅ Added: {file_name}")
+                    zinfo = zipfile.ZipInfo.from_file(file_path, file_name)
+                    
+                    # Write the stored entry straight from a read-only memory map of the file (no read buffer copy)
+                    zinfo.compress_type = zipfile.ZIP_STORED
+                    with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dest:
+                        if zinfo.file_size:
+                            with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                                if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                                dest.write(mapped)
+                    report.append(f"   ✅ Added: {file_name}")
                 
                 # Add metadata if requested
                 if include_metadata:
-                    metadata = self.generate_metadata(report_files)
-                    metadata_json = json.dumps(metadata, indent=2)
-                    zipf.writestr("reports_metadata.json", metadata_json)
-                    print(f"   ✅ Added: reports_metadata.json")
+                    metadata = self.generate_metadata(report_files, dict(report_entries))
+                    if orjson is not None:
+                        metadata_json = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+                    else:
+                        metadata_json = json.dumps(metadata, indent=2)
+                    zipf.writestr("reports_metadata.json", metadata_json, compress_type=zipfile.ZIP_DEFLATED,
+                                  compresslevel=TEXT_ENTRY_COMPRESSLEVEL)
+                    report.append(f"   ✅ Added: reports_metadata.json")
                     
                     # Create a readable summary
                     summary_text = self.generate_summary_text(metadata)
-                    zipf.writestr("REPORTS_SUMMARY.txt", summary_text)
-                    print(f"   ✅ Added: REPORTS_SUMMARY.txt")
+                    zipf.writestr("REPORTS_SUMMARY.txt", summary_text, compress_type=zipfile.ZIP_DEFLATED,
+                                  compresslevel=TEXT_ENTRY_COMPRESSLEVEL)
+                    report.append(f"   ✅ Added: REPORTS_SUMMARY.txt")
             
             # Get final zip size
             zip_size = os.path.getsize(zip_path) / (1024 * 1024)  # MB
             
-            print(f"\n🎉 Download package created successfully!")
-            print(f"📁 Location: {os.path.abspath(zip_path)}")
-            print(f"📊 Package size: {zip_size:.1f} MB")
-            print(f"📄 Contains: {len(report_files)} report files")
+            report += [
+                f"\n🎉 Download package created successfully!",
+                f"📁 Location: {os.path.abspath(zip_path)}",
+                f"📊 Package size: {zip_size:.1f} MB",
+                f"📄 Contains: {len(report_files)} report files"
+            ]
+            sys.stdout.write('\n'.join(report) + '\n')
             
             return zip_path
             
         except Exception as e:
-            print(f"❌ Error creating zip file: {e}")
+            report.append(f"❌ Error creating zip file: {e}")
+            sys.stdout.write('\n'.join(report) + '\n')
             return None
     
-    def generate_metadata(self, report_files: List[str]) -> Dict:
-        """Generate metadata for the reports"""
+    def generate_metadata(self, report_files: List[str], file_stats_by_path: Optional[Dict[str, os.stat_result]] = None) -> Dict:
+        """Generate metadata for the reports (file_stats_by_path: stat results already taken while listing them)"""
         metadata = {
             "package_info": {
                 "created_at": datetime.now().isoformat(),
@@ -101,7 +146,9 @@ class ReportsDownloadManager:
         
         for file_path in report_files:
             file_name = os.path.basename(file_path)
-            file_stats = os.stat(file_path)
+            file_stats = file_stats_by_path.get(file_path) if file_stats_by_path else None
+            if file_stats is None:
+                file_stats = os.stat(file_path)
             
             # Parse report type from filename
             report_type = "unknown"
@@ -129,7 +176,7 @@ class ReportsDownloadManager:
     
     def generate_summary_text(self, metadata: Dict) -> str:
         """Generate a human-readable summary"""
-        summary = f"""AI QUALITY ASSESSMENT REPORTS - DOWNLOAD PACKAGE
+        parts = [f"""AI QUALITY ASSESSMENT REPORTS - DOWNLOAD PACKAGE
 {'='*60}
 
 Package Information:
@@ -139,29 +186,36 @@ Package Information:
 
 Report Files:
 {'='*60}
-"""
+"""]
         
-        # Group reports by type
-        individual_reports = [r for r in metadata['reports'] if r['report_type'] == 'individual_assessment']
-        summary_reports = [r for r in metadata['reports'] if r['report_type'] == 'summary_report']
+        # Group reports by type (one pass over the reports)
+        individual_reports = []
+        summary_reports = []
+        for r in metadata['reports']:
+            if r['report_type'] == 'individual_assessment':
+                individual_reports.append(r)
+            elif r['report_type'] == 'summary_report':
+                summary_reports.append(r)
         
+        # The text is collected in parts and joined once instead of re-copied per line
         if summary_reports:
-            summary += f"\n📊 SUMMARY REPORTS ({len(summary_reports)}):\n"
+            parts.append(f"\n📊 SUMMARY REPORTS ({len(summary_reports)}):\n")
             for report in summary_reports:
-                summary += f"   • {report['filename']} ({report['file_size_mb']} MB)\n"
+                parts.append(f"   • {report['filename']} ({report['file_size_mb']} MB)\n")
         
         if individual_reports:
-            summary += f"\n🏢 INDIVIDUAL COMPANY REPORTS ({len(individual_reports)}):\n"
+            parts.append(f"\n🏢 INDIVIDUAL COMPANY REPORTS ({len(individual_reports)}):\n")
             for report in individual_reports:
-                summary += f"   • {report['company_name']}: {report['filename']} ({report['file_size_mb']} MB)\n"
+                parts.append(f"   • {report['company_name']}: {report['filename']} ({report['file_size_mb']} MB)\n")
         
-        summary += f"\n\nHow to Use These Reports:\n"
-        summary += f"{'='*60}\n"
-        summary += f"1. Summary Reports: Overall assessment across all companies\n"
-        summary += f"2. Individual Reports: Detailed analysis for each company\n"
-        summary += f"3. reports_metadata.json: Machine-readable metadata\n"
-        summary += f"\nAll reports are in PDF format and can be opened with any PDF viewer.\n"
+        parts.append(f"\n\nHow to Use These Reports:\n")
+        parts.append(f"{'='*60}\n")
+        parts.append(f"1. Summary Reports: Overall assessment across all companies\n")
+        parts.append(f"2. Individual Reports: Detailed analysis for each company\n")
+        parts.append(f"3. reports_metadata.json: Machine-readable metadata\n")
+        parts.append(f"\nAll reports are in PDF format and can be opened with any PDF viewer.\n")
         
+        summary = "".join(parts)
         return summary
     
     def clean_old_downloads(self, keep_latest: int = 5):
@@ -170,24 +224,25 @@ Report Files:
             return
         
         # Find all zip files in downloads directory
-        zip_files = glob.glob(os.path.join(self.downloads_dir, "AI_Quality_Reports_*.zip"))
+        zip_files = _scan_dir(self.downloads_dir, prefix="AI_Quality_Reports_", suffix=".zip")
         
         if len(zip_files) <= keep_latest:
             return
         
         # Sort by modification time (oldest first)
-        zip_files.sort(key=lambda x: os.path.getmtime(x))
+        zip_files.sort(key=lambda entry: entry.stat().st_mtime)
         
         # Remove oldest files
         files_to_remove = zip_files[:-keep_latest]
         
-        print(f"\n🧹 Cleaning up old download packages...")
-        for file_path in files_to_remove:
+        report = [f"\n🧹 Cleaning up old download packages..."]
+        for entry in files_to_remove:
             try:
-                os.remove(file_path)
-                print(f"   🗑️ Removed: {os.path.basename(file_path)}")
+                os.remove(entry.path)
+                report.append(f"   🗑️ Removed: {entry.name}")
             except Exception as e:
-                print(f"   ⚠️ Could not remove {os.path.basename(file_path)}: {e}")
+                report.append(f"   ⚠️ Could not remove {entry.name}: {e}")
+        sys.stdout.write('\n'.join(report) + '\n')
     
     def list_available_downloads(self):
         """List all available download packages"""
@@ -195,27 +250,32 @@ Report Files:
             print("📁 No downloads directory found")
             return
         
-        zip_files = glob.glob(os.path.join(self.downloads_dir, "AI_Quality_Reports_*.zip"))
+        zip_files = _scan_dir(self.downloads_dir, prefix="AI_Quality_Reports_", suffix=".zip")
         
         if not zip_files:
             print("📦 No download packages found")
             return
         
-        zip_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+        zip_files.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
         
-        print(f"📦 Available Download Packages:")
-        print(f"{'='*60}")
+        # The listing is collected and written in one call
+        listing = [f"📦 Available Download Packages:", f"{'='*60}"]
         
-        for i, file_path in enumerate(zip_files, 1):
-            file_name = os.path.basename(file_path)
-            file_size = os.path.getsize(file_path) / (1024 * 1024)  # MB
-            mod_time = datetime.fromtimestamp(os.path.getmtime(file_path))
+        for i, entry in enumerate(zip_files, 1):
+            file_path = entry.path
+            file_name = entry.name
+            file_stats = entry.stat()
+            file_size = file_stats.st_size / (1024 * 1024)  # MB
+            mod_time = datetime.fromtimestamp(file_stats.st_mtime)
             
-            print(f"{i}. {file_name}")
-            print(f"   📊 Size: {file_size:.1f} MB")
-            print(f"   📅 Created: {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"   📁 Path: {os.path.abspath(file_path)}")
-            print()
+            listing += [
+                f"{i}. {file_name}",
+                f"   📊 Size: {file_size:.1f} MB",
+                f"   📅 Created: {mod_time.strftime('%Y-%m-%d %H:%M:%S')}",
+                f"   📁 Path: {os.path.abspath(file_path)}",
+                ""
+            ]
+        sys.stdout.write('\n'.join(listing) + '\n')
 
 def main():
     """Command-line interface for report downloads"""
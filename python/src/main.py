@@ -3,8 +3,8 @@ import os
 import sys
 import subprocess
 from typing import Dict, Any
-from document_extractor import DocumentExtractor
-from claude_comparator import SemanticClaudeComparator
+from document_extractor import DocumentExtractor, configure_logging
+from claude_comparator import SemanticClaudeComparator, MAX_CONCURRENT_REQUESTS
 from report_generator import SemanticReportGenerator
 from datetime import datetime
 
@@ -22,7 +22,9 @@ class SemanticQualityTestOrchestrator:
             self.config = json.load(f)
         
         self.extractor = DocumentExtractor()
-        self.comparator = SemanticClaudeComparator()
+        self.comparator = SemanticClaudeComparator(
+            max_concurrent_requests=self.config.get('max_concurrent_requests', MAX_CONCURRENT_REQUESTS)
+        )
         self.reporter = SemanticReportGenerator()
         
         # Initialize download manager if available
@@ -38,6 +40,10 @@ class SemanticQualityTestOrchestrator:
         os.makedirs('data/reports', exist_ok=True)
         os.makedirs('downloads', exist_ok=True)  # For download packages
     
+    def close(self):
+        """Release the comparator's API connections and event loop"""
+        self.comparator.close()
+    
     def run_frontend_extraction(self):
         """NEW: Run Cypress verified recordsS data extraction"""
         print("🌐 STEP 1: VERIFIED RECORDS DATA EXTRACTION")
@@ -346,6 +352,7 @@ OPTIONS:
   --skip-frontend     Skip frontend extraction, use existing data
   --download-only     Only create download package from existing reports
   --list-downloads    List available download packages
+  --verbose, -v       Also show per-page and per-image extraction progress
   --help, -h          Show this help message
 
 EXAMPLES:
@@ -353,6 +360,7 @@ EXAMPLES:
   python main.py --skip-frontend   # Skip frontend extraction
   python main.py --download-only   # Create download package only
   python main.py --list-downloads  # List available downloads
+  python main.py -v --skip-frontend # Skip frontend extraction, verbose progress
 
 WORKFLOW:
 1. Frontend Data Extraction (Cypress)
@@ -366,9 +374,15 @@ def main():
         print("❌ config.json not found!")
         return
     
+    # The verbosity switch may appear anywhere; the remaining argument selects the mode
+    args = [arg.lower() for arg in sys.argv[1:]]
+    verbose = any(arg in ('--verbose', '-v') for arg in args)
+    args = [arg for arg in args if arg not in ('--verbose', '-v')]
+    configure_logging(verbose)
+    
     # Check for command line arguments
-    if len(sys.argv) > 1:
-        arg = sys.argv[1].lower()
+    if args:
+        arg = args[0]
         
         if arg in ['--help', '-h']:
             show_help()
@@ -378,41 +392,48 @@ def main():
             print("⏭️ Skipping frontend extraction (using existing data)")
             # Create orchestrator but skip frontend extraction
             orchestrator = SemanticQualityTestOrchestrator('config.json')
-            # Skip to quality assessment
-            print("🧠 STEP 2: AI QUALITY ASSESSMENT")
-            print("="*50)
-            all_results = {}
-            
-            for i, company in enumerate(orchestrator.config['companies'], 1):
-                print(f"\n[{i}/{len(orchestrator.config['companies'])}] Processing {company['name']}...")
+            try:
+                # Skip to quality assessment
+                print("🧠 STEP 2: AI QUALITY ASSESSMENT")
+                print("="*50)
+                all_results = {}
                 
-                try:
-                    result = orchestrator.process_company_semantic(company)
-                    if result:
-                        all_results[company['name']] = result
-                        
-                except Exception as e:
-                    print(f"❌ Error processing {company['name']}: {e}")
-                    import traceback
-                    traceback.print_exc()
-            
-            # Generate summary report
-            if all_results:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                summary_path = f"data/reports/semantic_summary_{timestamp}.pdf"
-                orchestrator.reporter.create_summary_report(all_results, summary_path)
+                for i, company in enumerate(orchestrator.config['companies'], 1):
+                    print(f"\n[{i}/{len(orchestrator.config['companies'])}] Processing {company['name']}...")
+                    
+                    try:
+                        result = orchestrator.process_company_semantic(company)
+                        if result:
+                            all_results[company['name']] = result
+                            
+                    except Exception as e:
+                        print(f"❌ Error processing {company['name']}: {e}")
+                        import traceback
+                        traceback.print_exc()
                 
-                # Create download package
-                orchestrator.create_download_package()
+                # Generate summary report
+                if all_results:
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    summary_path = f"data/reports/semantic_summary_{timestamp}.pdf"
+                    orchestrator.reporter.create_summary_report(all_results, summary_path)
+                    
+                    # Create download package
+                    orchestrator.create_download_package()
+                    
+                    print(f"\n✅ Quality assessment completed (frontend extraction skipped)")
                 
-                print(f"\n✅ Quality assessment completed (frontend extraction skipped)")
+            finally:
+                orchestrator.close()
             
             return
         
         elif arg == "--download-only":
             print("📦 Creating download package only...")
             orchestrator = SemanticQualityTestOrchestrator('config.json')
-            zip_path = orchestrator.create_download_package()
+            try:
+                zip_path = orchestrator.create_download_package()
+            finally:
+                orchestrator.close()
             if not zip_path:
                 print("❌ No reports found to package")
             return
@@ -434,7 +455,10 @@ def main():
     # Default: Run full workflow
     try:
         orchestrator = SemanticQualityTestOrchestrator('config.json')
-        orchestrator.run_semantic_assessment()
+        try:
+            orchestrator.run_semantic_assessment()
+        finally:
+            orchestrator.close()
     except Exception as e:
         print(f"❌ Fatal error: {e}")
         import traceback
@@ -0,0 +1,55 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import claude_comparator
+
+
+# Overlapping numeric terms: '000' occurs more often with overlaps than without in these values
+DOCUMENTS = [
+    "The company raised $100000 in 2000000 shares.\n\nRevenue reached 0000 units.\n\nThe team has 12 employees.",
+    "Funding round of $1,000,000 led by Acme.\n\nValuation of 10,000,000 after the round.\n\n000000 startup business.",
+    "Founded in 2000.\n\nThe CEO said 20000000 was raised.\n\nNothing relevant here at all.",
+    "Units sold across all regions: 0000000 in total.\n\nUnits sold across all regions: 000 000 000 total.",
+]
+
+VALUES = ['10,000,000', '$1,000,000', '2000000', '000']
+
+
+@pytest.fixture
+def comparator():
+    comparator = claude_comparator.SemanticClaudeComparator(api_key='test-key', cache_dir=None)
+    yield comparator
+    comparator.close()
+
+
+@pytest.mark.skipif(claude_comparator.ahocorasick is None, reason="pyahocorasick not installed")
+@pytest.mark.parametrize("document", DOCUMENTS)
+@pytest.mark.parametrize("value", VALUES)
+def test_automaton_matches_fallback_on_overlapping_terms(comparator, monkeypatch, document, value):
+    """The automaton path keeps the non-overlapping per-term counts of the str.count fallback"""
+    with_automaton = comparator._create_contextual_chunk('amount_raised', value, document, max_chars=60)
+
+    # Chunks are cached per comparator, so drop the automaton result before taking the fallback path
+    comparator._chunk_cache.clear()
+    monkeypatch.setattr(claude_comparator, 'ahocorasick', None)
+    without_automaton = comparator._create_contextual_chunk('amount_raised', value, document, max_chars=60)
+
+    assert with_automaton == without_automaton
+
+
+def test_overlapping_hits_are_not_counted_twice(comparator):
+    """'0000000' holds two non-overlapping '000' hits, so the section with three separate ones ranks first"""
+    document = DOCUMENTS[-1]
+    chunk = comparator._create_contextual_chunk('revenue', '000', document, max_chars=60)
+
+    assert chunk == "Units sold across all regions: 000 000 000 total."
+
+
+def test_claim_keywords_keep_unicode_case_folding():
+    """re.IGNORECASE also folds U+017F (long s) and U+212A (Kelvin sign) onto ASCII letters"""
+    assert claude_comparator._CLAIM_FACT_PAT.search("The ſeries B round closed")
+    assert claude_comparator._CLAIM_FACT_PAT.search("The Series \u212a round closed")